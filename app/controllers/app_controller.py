@@ -1,71 +1,148 @@
-import json
+import os
 import sys
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator
 
-from PySide6.QtCore import QObject
-from PySide6.QtWidgets import QApplication
+import msgspec
+from loguru import logger
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QApplication, QSplashScreen
 
-from app.controllers.main_window_controller import MainWindowController
-from app.controllers.settings_controller import SettingsController
 from app.models.settings import Settings
 from app.utils.app_info import AppInfo
 from app.utils.constants import DEFAULT_USER_RULES
 from app.utils.gui_info import GUIInfo
-from app.utils.metadata import MetadataManager
-from app.utils.steam.steamcmd.wrapper import SteamcmdInterface
-from app.views.main_window import MainWindow
-from app.views.settings_dialog import SettingsDialog
+
+# Set RIMSORT_PROFILE_STARTUP=1 to log how long each startup step takes
+PROFILE_STARTUP = os.environ.get("RIMSORT_PROFILE_STARTUP") == "1"
+
+
+@contextmanager
+def _profile(name: str) -> Iterator[None]:
+    """Log the wall-clock time of a startup step when startup profiling is enabled."""
+    if not PROFILE_STARTUP:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        logger.info(f"[startup] {name}: {(perf_counter() - start) * 1000:.1f}ms")
 
 
 class AppController(QObject):
     def __init__(self) -> None:
         super().__init__()
 
-        self.app = QApplication(sys.argv)
-
-        self.app.setStyle("Fusion")
-
-        self.app.setStyleSheet(  # Add style sheet for styling layouts and widgets
-            (
-                AppInfo().application_folder / "themes" / "RimPy" / "style.qss"
-            ).read_text()
-        )
-        self.app.setWindowIcon(GUIInfo().app_icon)
-
-        # One-time initialization of userRules.json
-        user_rules_path = AppInfo().databases_folder / "userRules.json"
-        if not user_rules_path.exists():
-            initial_rules_db = DEFAULT_USER_RULES
-            with open(user_rules_path, "w", encoding="utf-8") as output:
-                json.dump(initial_rules_db, output, indent=4)
-
-        # Instantiate the settings model, view and controller
-        self.settings = Settings()
-        self.settings_dialog = SettingsDialog()
-        self.settings_controller = SettingsController(
-            model=self.settings, view=self.settings_dialog
-        )
-
-        # Initialize SteamcmdInterface
-        self.steamcmd_wrapper = SteamcmdInterface.instance(
-            self.settings_controller.settings.instances[
-                self.settings_controller.settings.current_instance
-            ].steamcmd_install_path,
-            self.settings_controller.settings.steamcmd_validate_downloads,
-        )
-
-        # Initialize the MetadataManager
-        self.metadata_manager = MetadataManager.instance(
-            settings_controller=self.settings_controller
-        )
-
-        # Instantiate the main window and its controller
-        self.main_window = MainWindow(settings_controller=self.settings_controller)
-        self.main_window_controller = MainWindowController(self.main_window)
+        with _profile("QApplication"):
+            self.app = QApplication(sys.argv)
+
+        with _profile("Style"):
+            self.app.setStyle("Fusion")
+
+            # Add style sheet for styling layouts and widgets. If the bundled
+            # stylesheet is missing, fall back to plain Fusion instead of crashing
+            stylesheet_path = AppInfo().theme_data_folder / "RimPy" / "style.qss"
+            try:
+                self.app.setStyleSheet(stylesheet_path.read_bytes().decode("utf-8"))
+            except FileNotFoundError:
+                logger.warning(
+                    f"Stylesheet not found at {stylesheet_path}, using default style"
+                )
+            self.app.setWindowIcon(GUIInfo().app_icon)
+
+        with _profile("Splash"):
+            # Paint a lightweight splash before pulling in the heavy view modules
+            self.splash = QSplashScreen(GUIInfo().app_icon)
+            self.splash.show()
+            self.app.processEvents()
+
+        self._initialize_error: Exception | None = None
+
+        try:
+            with _profile("View imports"):
+                # These transitively import most of the Qt widget tree and the
+                # metadata stack, so they are deferred until the splash is on screen
+                from app.controllers.main_window_controller import MainWindowController
+                from app.views.main_window import MainWindow
+
+            with _profile("User rules"):
+                # One-time initialization of userRules.json. Exclusive creation makes
+                # this a single open() on first launch and a no-op afterwards
+                user_rules_path = AppInfo().databases_folder / "userRules.json"
+                try:
+                    with open(user_rules_path, "xb") as output:
+                        output.write(
+                            msgspec.json.format(
+                                msgspec.json.encode(DEFAULT_USER_RULES), indent=4
+                            )
+                        )
+                except FileExistsError:
+                    pass
+
+            # Instantiate the settings model and controller. Constructing the
+            # controller loads the settings from disk; the settings dialog is only
+            # built when it is first shown
+            with _profile("Settings"):
+                self.settings = Settings()
+            with _profile("SettingsController"):
+                from app.controllers.settings_controller import SettingsController
+
+                self.settings_controller = SettingsController(model=self.settings)
+
+            # Initialize SteamcmdInterface and the MetadataManager. The main window's
+            # panels fetch these singletons without arguments, so they are primed here
+            with _profile("SteamcmdInterface"):
+                from app.utils.steam.steamcmd.wrapper import SteamcmdInterface
+
+                self.steamcmd_wrapper = SteamcmdInterface.instance(
+                    self.settings.instances[
+                        self.settings.current_instance
+                    ].steamcmd_install_path,
+                    self.settings.steamcmd_validate_downloads,
+                )
+            with _profile("MetadataManager"):
+                from app.utils.metadata import MetadataManager
+
+                self.metadata_manager = MetadataManager.instance(
+                    settings_controller=self.settings_controller
+                )
+
+            # Instantiate the main window and its controller
+            with _profile("MainWindow"):
+                self.main_window = MainWindow(
+                    settings_controller=self.settings_controller
+                )
+            with _profile("MainWindowController"):
+                self.main_window_controller = MainWindowController(self.main_window)
+        except BaseException:
+            # Don't leave the frameless splash on screen over the fatal error
+            # dialog when startup fails
+            self.splash.close()
+            raise
 
     def run(self) -> int:
         self.main_window.show()
-        self.main_window.initialize_content(is_initial=True)
-        return self.app.exec()
+        self.splash.finish(self.main_window)
+        # Let the window paint before the (blocking) initial content refresh
+        QTimer.singleShot(0, self._initialize_content)
+        exit_code = self.app.exec()
+        # Re-raise a failed initial load so the caller handles it like any
+        # other startup error
+        if self._initialize_error is not None:
+            raise self._initialize_error
+        return exit_code
+
+    def _initialize_content(self) -> None:
+        try:
+            with _profile("Initial content"):
+                self.main_window.initialize_content(is_initial=True)
+        except Exception as e:
+            # Exceptions raised here would otherwise go to sys.excepthook,
+            # so stash it and leave the event loop
+            self._initialize_error = e
+            self.app.quit()
 
     def shutdown_watchdog(self) -> None:
         self.main_window.shutdown_watchdog()
@@ -2,6 +2,7 @@ import sys
 from dataclasses import dataclass
 from json import JSONDecodeError
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from loguru import logger
 from PySide6.QtCore import QObject, Slot
@@ -17,7 +18,9 @@ from app.views.dialogue import (
     show_dialogue_file,
     show_settings_error,
 )
-from app.views.settings_dialog import SettingsDialog
+
+if TYPE_CHECKING:
+    from app.views.settings_dialog import SettingsDialog
 
 
 class SettingsController(QObject):
@@ -37,25 +40,41 @@ class SettingsController(QObject):
         >>> controller.settings.some_property
     """
 
-    def __init__(self, model: Settings, view: SettingsDialog) -> None:
+    def __init__(self, model: Settings) -> None:
         """
-        Initialize the `SettingsController` with the given `Settings` model and `SettingsDialog` view.
+        Initialize the `SettingsController` with the given `Settings` model.
 
         Upon initialization, the provided settings model's `load` method is called to ensure
-        that the settings are loaded and available for use. The view is also initialized with values
-        from the settings model.
+        that the settings are loaded and available for use. The `SettingsDialog` view is only
+        built, and initialized with values from the settings model, when it is first used.
 
         Args:
             model (Settings): The settings model to be managed by this controller.
-            view (SettingsDialog): The settings dialog to be managed by this controller.
         """
         super().__init__()
 
         self.settings = model
-        self.settings_dialog = view
+        self._settings_dialog: "SettingsDialog | None" = None
 
         self._last_file_dialog_path = str(Path.home())
 
+        # Connect signals from dialogs
+        EventBus().reset_settings_file.connect(self._do_reset_settings_file)
+
+        self._load_settings()
+
+    @property
+    def settings_dialog(self) -> "SettingsDialog":
+        """
+        The settings dialog managed by this controller, built on first use.
+        """
+        if self._settings_dialog is not None:
+            return self._settings_dialog
+
+        from app.views.settings_dialog import SettingsDialog
+
+        self._settings_dialog = SettingsDialog()
+
         # Initialize the settings dialog from the settings model
 
         self._update_view_from_model()
@@ -211,10 +230,7 @@ class SettingsController(QObject):
             self._on_steamcmd_install_button_clicked
         )
 
-        # Connect signals from dialogs
-        EventBus().reset_settings_file.connect(self._do_reset_settings_file)
-
-        self._load_settings()
+        return self.settings_dialog
 
     def _load_settings(self) -> None:
         logger.info("Attempting to load settings from settings file")
@@ -280,10 +296,21 @@ class SettingsController(QObject):
         """
         Update the view from the model and show the settings dialog.
         """
-        self._update_view_from_model()
+        # Building the dialog on first use already updates it from the model
+        already_built = self._settings_dialog is not None
+        settings_dialog = self.settings_dialog
+        if already_built:
+            self._update_view_from_model()
         if tab_name:
-            self.settings_dialog.switch_to_tab(tab_name)
-        self.settings_dialog.show()
+            settings_dialog.switch_to_tab(tab_name)
+        settings_dialog.show()
+
+    def is_settings_dialog_visible(self) -> bool:
+        """
+        Return whether the settings dialog is shown, without building it if it
+        has not been used yet.
+        """
+        return self._settings_dialog is not None and self._settings_dialog.isVisible()
 
     def create_instance(
         self,
@@ -1,3 +1,4 @@
+import mmap
 import os
 import platform
 import shutil
@@ -10,6 +11,7 @@ from re import sub
 from stat import S_IRWXG, S_IRWXO, S_IRWXU
 from typing import Any, Callable, Generator
 
+import msgspec
 import requests
 from loguru import logger
 from pyperclip import (  # type: ignore # Stubs don't exist for pyperclip
@@ -101,10 +103,13 @@ def rmtree(path: str | Path, **kwargs: Any) -> bool:
 def delete_files_with_condition(
     directory: Path | str, condition: Callable[[str], bool]
 ) -> None:
+    # os.walk does not follow symlinked folders by default. Paths are built by
+    # concatenating onto a per-directory prefix rather than a Path per entry
     for root, dirs, files in os.walk(directory):
+        root_prefix = os.path.join(root, "")
         for file in files:
             if condition(file):
-                file_path = str((Path(root) / file))
+                file_path = root_prefix + file
                 try:
                     os.remove(file_path)
                 except OSError:
@@ -113,8 +118,9 @@ def delete_files_with_condition(
                     logger.debug(f"Deleted: {file_path}")
 
     for root, dirs, _ in os.walk(directory, topdown=False):
+        root_prefix = os.path.join(root, "")
         for _dir in dirs:
-            dir_path = str((Path(root) / _dir))
+            dir_path = root_prefix + _dir
             if not os.listdir(dir_path):
                 shutil.rmtree(
                     dir_path,
@@ -139,6 +145,24 @@ def delete_files_only_extension(directory: Path | str, extension: str) -> None:
     delete_files_with_condition(directory, lambda file: file.endswith(extension))
 
 
+def decode_json_file(path: Path | str) -> Any:
+    """
+    Decode a JSON file through a read-only memory map.
+
+    The decoder reads straight from the mapped pages, so no intermediate bytes
+    or str copy of the file contents is created.
+
+    :param path: Path to the JSON file
+    :return: The decoded JSON document
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped, let the decoder raise its usual error
+            return msgspec.json.decode(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return msgspec.json.decode(mm)
+
+
 def directories(mods_path: Path | str) -> list[str]:
     try:
         with os.scandir(mods_path) as directories:
@@ -1,14 +1,14 @@
-import json
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from re import match
 from time import localtime, strftime, time
-from typing import Any, Iterable, Union
+from typing import Any, Callable, Iterable, Union
 from uuid import uuid4
 
+import msgspec
 from loguru import logger
-from natsort import natsorted
+from natsort import natsort_keygen
 from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal
 
 from app.controllers.settings_controller import SettingsController
@@ -19,21 +19,29 @@ from app.utils.constants import (
     DEFAULT_USER_RULES,
     RIMWORLD_DLC_METADATA,
 )
-from app.utils.generic import directories
+from app.utils.generic import decode_json_file, directories
 from app.utils.schema import generate_rimworld_mods_list, validate_rimworld_mods_list
 from app.utils.steam.steamcmd.wrapper import SteamcmdInterface
 from app.utils.steam.steamfiles.wrapper import acf_to_dict, dict_to_acf
 from app.utils.steam.webapi.wrapper import (
+    BASE_URL_STEAMFILES,
     DynamicQuery,
     ISteamRemoteStorage_GetPublishedFileDetails,
 )
-from app.utils.xml import json_to_xml_write, xml_path_to_json
+from app.utils.xml import (
+    json_to_xml_write,
+    mods_list_path_to_json,
+    xml_path_to_json,
+)
 from app.views.dialogue import (
     show_dialogue_conditional,
     show_dialogue_file,
     show_warning,
 )
 
+# Natural sort key, used to pick between duplicate mod paths
+_NATSORT_KEY = natsort_keygen()
+
 # Locally installed mod metadata
 
 
@@ -44,6 +52,24 @@ class MetadataManager(QObject):
     mod_metadata_updated_signal = Signal(str)
     show_warning_signal = Signal(str, str, str, str)
 
+    # About.xml load order tags, with the rule key they populate on the mod and
+    # the inverse key populated on the referenced mods
+    _LOAD_ORDER_TAGS = (
+        ("loadafter", "loadTheseBefore", "loadTheseAfter"),
+        ("forceloadafter", "loadTheseBefore", "loadTheseAfter"),
+        ("loadbefore", "loadTheseAfter", "loadTheseBefore"),
+        ("forceloadbefore", "loadTheseAfter", "loadTheseBefore"),
+    )
+    _LOAD_ORDER_BY_VERSION_TAGS = (
+        ("loadafterbyversion", "loadTheseBefore", "loadTheseAfter"),
+        ("loadbeforebyversion", "loadTheseAfter", "loadTheseBefore"),
+    )
+    # Community Rules / User Rules keys, mapped the same way
+    _EXTERNAL_RULE_KEYS = (
+        ("loadBefore", "loadTheseAfter", "loadTheseBefore"),
+        ("loadAfter", "loadTheseBefore", "loadTheseAfter"),
+    )
+
     def __new__(cls, *args: Any, **kwargs: Any) -> "MetadataManager":
         if cls._instance is None:
             cls._instance = super(MetadataManager, cls).__new__(cls)
@@ -72,6 +98,9 @@ class MetadataManager(QObject):
             self.external_user_rules_path: str = str(
                 AppInfo().databases_folder / "userRules.json"
             )
+            # Last loaded data per external DB / .acf file, with the path and the
+            # (mtime_ns, size) it was read at
+            self.__file_cache: dict[str, tuple[str, tuple[int, int], Any]] = {}
             # Local metadata
             self.internal_local_metadata: dict[str, Any] = {}
             # Mappers
@@ -79,6 +108,7 @@ class MetadataManager(QObject):
             self.mod_metadata_dir_mapper: dict[str, str] = {}
             self.packageid_to_uuids: dict[str, set[str]] = {}
             self.steamdb_packageid_to_name: dict[str, str] = {}
+            self.steamdb_pfid_to_packageid: dict[str, str] = {}
             # Empty game version string unless the data is populated
             self.game_version: str = ""
             # SteamCMD .acf file data
@@ -105,25 +135,56 @@ class MetadataManager(QObject):
             raise ValueError("MetadataManager instance has already been initialized.")
         return cls._instance
 
+    def __load_cached(
+        self,
+        kind: str,
+        path: str,
+        loader: Callable[[str], Any] = decode_json_file,
+    ) -> Any:
+        """
+        Load a metadata file, reusing the previous result if the file is unchanged.
+
+        :param kind: The kind of file being loaded, used as the cache key
+        :param path: Path to the file
+        :param loader: Function used to parse the file, JSON decoding by default
+        :return: The loaded data
+        """
+        stat = os.stat(path)
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self.__file_cache.get(kind)
+        if cached is not None and cached[0] == path and cached[1] == file_key:
+            logger.debug(f"{kind} is unchanged since it was last read")
+            return cached[2]
+        data = loader(path)
+        self.__file_cache[kind] = (path, file_key, data)
+        return data
+
     def __refresh_external_metadata(self) -> None:
+        # Warnings are collected here and shown together once every DB is loaded
+        pending_warnings: list[tuple[str, str, str, str]] = []
+
         def validate_db_path(path: str, db_type: str) -> bool:
             if not os.path.exists(path):
-                self.show_warning_signal.emit(
-                    f"{db_type} DB is missing",
-                    f"Configured {db_type} DB not found!",
-                    f"Unable to initialize external metadata. There is no external {db_type} metadata being factored!\n"
-                    + "\nPlease make sure your Database location settings are correct.",
-                    f"{path}",
+                pending_warnings.append(
+                    (
+                        f"{db_type} DB is missing",
+                        f"Configured {db_type} DB not found!",
+                        f"Unable to initialize external metadata. There is no external {db_type} metadata being factored!\n"
+                        + "\nPlease make sure your Database location settings are correct.",
+                        f"{path}",
+                    )
                 )
                 return False
 
             if os.path.isdir(path):
-                self.show_warning_signal.emit(
-                    f"{db_type} DB is missing",
-                    f"Configured {db_type} DB path is a directory! Expected a file path.",
-                    f"Unable to initialize external metadata. There is no external {db_type} metadata being factored!\n"
-                    + "\nPlease make sure your Database location settings are correct.",
-                    f"{path}",
+                pending_warnings.append(
+                    (
+                        f"{db_type} DB is missing",
+                        f"Configured {db_type} DB path is a directory! Expected a file path.",
+                        f"Unable to initialize external metadata. There is no external {db_type} metadata being factored!\n"
+                        + "\nPlease make sure your Database location settings are correct.",
+                        f"{path}",
+                    )
                 )
                 return False
 
@@ -140,50 +201,55 @@ class MetadataManager(QObject):
             logger.info(
                 "Steam DB exists!",
             )
-            with open(path, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.info("Checking metadata expiry against database...")
-                db_data = json.loads(json_string)
-                current_time = int(time())
-                db_time = int(db_data["version"])
-                elapsed = current_time - db_time
-                if (
-                    elapsed <= life
-                ):  # If the duration elapsed since db creation is less than expiry than expiry
-                    # The data is valid
-                    db_json_data = db_data[
-                        "database"
-                    ]  # TODO: additional check to verify integrity of this data's schema
-                    logger.info(
-                        "Cached Steam DB is valid! Returning data to RimSort..."
-                    )
-                    total_entries = len(db_json_data)
-                    logger.info(
-                        f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
-                    )
-                else:  # If the cached db data is expired but NOT missing
-                    # Fallback to the expired metadata
-                    if life != 0:  # Disable Notification if value is 0
-                        self.show_warning_signal.emit(
+            logger.info("Checking metadata expiry against database...")
+            db_data = self.__load_cached("Steam DB", path)
+            # The DB version is already decoded as an integer timestamp
+            db_time = db_data["version"]
+            elapsed = int(time()) - db_time
+            if (
+                elapsed <= life
+            ):  # If the duration elapsed since db creation is less than expiry than expiry
+                # The data is valid
+                db_json_data = db_data[
+                    "database"
+                ]  # TODO: additional check to verify integrity of this data's schema
+                logger.info("Cached Steam DB is valid! Returning data to RimSort...")
+                total_entries = len(db_json_data)
+                logger.info(
+                    f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
+                )
+            else:  # If the cached db data is expired but NOT missing
+                # Fallback to the expired metadata
+                if life != 0:  # Disable Notification if value is 0
+                    pending_warnings.append(
+                        (
                             "Steam DB metadata expired",
                             "Steam DB is expired! Consider updating!\n",
-                            f'Steam DB last updated: {strftime("%Y-%m-%d %H:%M:%S", localtime(db_data["version"] - life))}\n\n'
+                            f'Steam DB last updated: {strftime("%Y-%m-%d %H:%M:%S", localtime(db_time - life))}\n\n'
                             + "Falling back to cached, but EXPIRED Steam Database...",
                             "",
                         )
-                    db_json_data = db_data[
-                        "database"
-                    ]  # TODO: additional check to verify integrity of this data's schema
-                    total_entries = len(db_json_data)
-                    logger.info(
-                        f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
                     )
-                self.steamdb_packageid_to_name = {
-                    metadata["packageid"]: metadata["name"]
-                    for metadata in db_data.get("database", {}).values()
-                    if metadata.get("packageid") and metadata.get("name")
-                }
-                return db_json_data, path
+                db_json_data = db_data[
+                    "database"
+                ]  # TODO: additional check to verify integrity of this data's schema
+                total_entries = len(db_json_data)
+                logger.info(
+                    f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
+                )
+            # Only rebuild the packageid lookups if the DB was actually re-read
+            if db_json_data is not self.external_steam_metadata:
+                pfid_to_packageid: dict[str, str] = {}
+                packageid_to_name: dict[str, str] = {}
+                for publishedfileid, metadata in db_json_data.items():
+                    if package_id := metadata.get("packageid"):
+                        package_id = package_id.lower()  # Normalize packageid
+                        pfid_to_packageid[publishedfileid] = package_id
+                        if name := metadata.get("name"):
+                            packageid_to_name[package_id] = name
+                self.steamdb_pfid_to_packageid = pfid_to_packageid
+                self.steamdb_packageid_to_name = packageid_to_name
+            return db_json_data, path
 
         def get_configured_community_rules_db(
             path: str,
@@ -197,49 +263,37 @@ class MetadataManager(QObject):
             logger.info(
                 "Community Rules DB exists!",
             )
-            with open(path, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.info("Reading info from communityRules.json")
-                rule_data = json.loads(json_string)
-                community_rules_json_data = rule_data["rules"]
-                total_entries = len(community_rules_json_data)
-                logger.info(
-                    f"Loaded {total_entries} additional sorting rules from Community Rules"
-                )
-                return community_rules_json_data, path
+            logger.info("Reading info from communityRules.json")
+            rule_data = self.__load_cached("Community Rules DB", path)
+            community_rules_json_data = rule_data["rules"]
+            total_entries = len(community_rules_json_data)
+            logger.info(
+                f"Loaded {total_entries} additional sorting rules from Community Rules"
+            )
+            return community_rules_json_data, path
 
         # Load external metadata
+        settings = self.settings_controller.settings
+        databases_folder = AppInfo().databases_folder
         # External Steam metadata
-        if (
-            self.settings_controller.settings.external_steam_metadata_source
-            == "Configured file path"
-        ):
+        if settings.external_steam_metadata_source == "Configured file path":
             (
                 self.external_steam_metadata,
                 self.external_steam_metadata_path,
             ) = get_configured_steam_db(
-                life=self.settings_controller.settings.database_expiry,
-                path=self.settings_controller.settings.external_steam_metadata_file_path,
+                life=settings.database_expiry,
+                path=settings.external_steam_metadata_file_path,
             )
-        elif (
-            self.settings_controller.settings.external_steam_metadata_source
-            == "Configured git repository"
-        ):
+        elif settings.external_steam_metadata_source == "Configured git repository":
             (
                 self.external_steam_metadata,
                 self.external_steam_metadata_path,
             ) = get_configured_steam_db(
-                life=self.settings_controller.settings.database_expiry,
-                path=str(
-                    (
-                        os.path.join(
-                            str(AppInfo().databases_folder),
-                            os.path.split(
-                                self.settings_controller.settings.external_steam_metadata_repo
-                            )[1],
-                            "steamDB.json",
-                        )
-                    )
+                life=settings.database_expiry,
+                path=os.path.join(
+                    str(databases_folder),
+                    os.path.split(settings.external_steam_metadata_repo)[1],
+                    "steamDB.json",
                 ),
             )
         else:
@@ -248,18 +302,15 @@ class MetadataManager(QObject):
             )
 
         # External Community Rules metadata
-        if (
-            self.settings_controller.settings.external_community_rules_metadata_source
-            == "Configured file path"
-        ):
+        if settings.external_community_rules_metadata_source == "Configured file path":
             (
                 self.external_community_rules,
                 self.external_community_rules_path,
             ) = get_configured_community_rules_db(
-                path=self.settings_controller.settings.external_community_rules_file_path,
+                path=settings.external_community_rules_file_path,
             )
         elif (
-            self.settings_controller.settings.external_community_rules_metadata_source
+            settings.external_community_rules_metadata_source
             == "Configured git repository"
         ):
             (
@@ -267,15 +318,9 @@ class MetadataManager(QObject):
                 self.external_community_rules_path,
             ) = get_configured_community_rules_db(
                 path=str(
-                    (
-                        Path(str(AppInfo().databases_folder))
-                        / Path(
-                            os.path.split(
-                                self.settings_controller.settings.external_community_rules_repo
-                            )[1]
-                        )
-                        / "communityRules.json"
-                    )
+                    databases_folder
+                    / os.path.split(settings.external_community_rules_repo)[1]
+                    / "communityRules.json"
                 ),
             )
         else:
@@ -285,9 +330,9 @@ class MetadataManager(QObject):
         # External User Rules metadata
         if os.path.exists(self.external_user_rules_path):
             logger.info("Loading userRules.json")
-            with open(self.external_user_rules_path, encoding="utf-8") as f:
-                json_string = f.read()
-                self.external_user_rules = json.loads(json_string)["rules"]
+            self.external_user_rules = self.__load_cached(
+                "User Rules DB", self.external_user_rules_path
+            )["rules"]
             total_entries = 0
             if self.external_user_rules is not None:
                 total_entries = len(self.external_user_rules)
@@ -300,18 +345,32 @@ class MetadataManager(QObject):
             logger.info(
                 "Unable to find userRules.json in storage. Creating new user rules db!"
             )
-            with open(
-                self.external_user_rules_path,
-                "w",
-                encoding="utf-8",
-            ) as output:
-                json.dump(DEFAULT_USER_RULES, output, indent=4)
+            with open(self.external_user_rules_path, "wb") as output:
+                output.write(
+                    msgspec.json.format(
+                        msgspec.json.encode(DEFAULT_USER_RULES), indent=4
+                    )
+                )
             self.external_user_rules = (
                 DEFAULT_USER_RULES["rules"]
                 if isinstance(DEFAULT_USER_RULES["rules"], dict)
                 else {}
             )
 
+        # Surface all external metadata warnings in a single dialogue
+        if len(pending_warnings) == 1:
+            self.show_warning_signal.emit(*pending_warnings[0])
+        elif pending_warnings:
+            self.show_warning_signal.emit(
+                "External metadata warnings",
+                f"{len(pending_warnings)} problems were found while loading external metadata.",
+                "\n\n".join(
+                    f"{text.strip()}\n{information}"
+                    for _, text, information, _ in pending_warnings
+                ),
+                "\n".join(details for *_, details in pending_warnings if details),
+            )
+
     def __refresh_internal_metadata(self, is_initial: bool = False) -> None:
         def batch_by_data_source(
             data_source: str, mod_directories: list[str]
@@ -323,12 +382,15 @@ class MetadataManager(QObject):
                 data_source (str): The data source to batch.
                 mod_directories (list[str]): A list of mod directories to use to filter items not in that batch.
             """
+            # Only mint a UUID for directories we have not seen before. A
+            # dict.get() default would be evaluated for every path
+            dir_mapper = self.mod_metadata_dir_mapper
             return {
-                path: self.mod_metadata_dir_mapper.get(path, str(uuid4()))
+                path: dir_mapper[path] if path in dir_mapper else str(uuid4())
                 for path in mod_directories
             }
 
-        def purge_by_data_source(data_source: str, batch: list[str] = []) -> None:
+        def purge_by_data_source(data_source: str, batch: Iterable[str] = ()) -> None:
             """
             Removes all metadata for a given data source.
 
@@ -336,20 +398,15 @@ class MetadataManager(QObject):
 
             Parameters:
                 data_source (str): The data source to purge.
-                batch (list[str], optional): A list of uuids to use to filter items not in that batch.
+                batch (Iterable[str], optional): The uuids to use to filter items not in that batch.
             """
-            if not batch:  # Purge all metadata for a given data source
-                uuids_to_remove = [
-                    uuid
-                    for uuid, metadata in self.internal_local_metadata.items()
-                    if metadata.get("data_source") == data_source
-                ]
-            else:  # Purge all metadata for a given data source that is not in the batch
-                uuids_to_remove = [
-                    uuid
-                    for uuid, metadata in self.internal_local_metadata.items()
-                    if metadata.get("data_source") == data_source and uuid not in batch
-                ]
+            # Hash the batch once so each membership test below is O(1)
+            batch_set = frozenset(batch)
+            uuids_to_remove = [
+                uuid
+                for uuid, metadata in self.internal_local_metadata.items()
+                if metadata.get("data_source") == data_source and uuid not in batch_set
+            ]
             # If we have uuids to remove
             if uuids_to_remove:
                 logger.debug(
@@ -376,10 +433,12 @@ class MetadataManager(QObject):
                         self.packageid_to_uuids[deleted_mod_packageid].remove(uuid)
 
         # Get & set Rimworld version string
-        game_folder = self.settings_controller.settings.instances[
-            self.settings_controller.settings.current_instance
-        ].game_folder
-        version_file_path = str(game_folder / Path("Version.txt"))
+        settings = self.settings_controller.settings
+        instance = settings.instances[settings.current_instance]
+        game_folder = instance.game_folder
+        # Build the game folder path once and derive the others from it
+        game_path = Path(game_folder)
+        version_file_path = str(game_path / "Version.txt")
         if os.path.exists(version_file_path):
             try:
                 with open(version_file_path, encoding="utf-8") as f:
@@ -398,24 +457,35 @@ class MetadataManager(QObject):
             self.show_warning_signal.emit(
                 "Missing Version.txt",
                 f"RimSort is unable to get the game version at the expected path: [{version_file_path}].",
-                f"\nIs your game path [{self.settings_controller.settings.instances[self.settings_controller.settings.current_instance].game_folder}] set correctly? There should be a Version.txt file in the game install directory.",
+                f"\nIs your game path [{game_folder}] set correctly? There should be a Version.txt file in the game install directory.",
                 "",
             )
+        # Enumerate the expansion, local and workshop folders concurrently. The
+        # scans are I/O-bound, so they overlap well in threads
+        local_folder = instance.local_folder
+        workshop_folder = instance.workshop_folder
+        data_path = str(game_path / "Data") if game_folder else ""
+        scan_folders = [
+            folder for folder in (data_path, local_folder, workshop_folder) if folder
+        ]
+        with ThreadPoolExecutor(max_workers=max(len(scan_folders), 1)) as executor:
+            subdirectories = dict(
+                zip(scan_folders, executor.map(directories, scan_folders))
+            )
         # Get and cache installed base game / DLC data
-        if game_folder and game_folder != Path():
+        if data_path:
             # Get mod data
-            data_path = str(game_folder / Path("Data"))
             logger.info(
                 f"Querying Official expansions from RimWorld's Data folder: {data_path}"
             )
             # Scan our Official expansions directory
-            expansion_subdirectories = directories(data_path)
+            expansion_subdirectories = subdirectories[data_path]
             expansions_batch = batch_by_data_source(
                 "expansion", expansion_subdirectories
             )
             if not is_initial:
                 # Pop any uuids from metadata that are not in the batch - these can be leftover from a previous directory
-                purge_by_data_source("expansion", list(expansions_batch.values()))
+                purge_by_data_source("expansion", expansions_batch.values())
             # Query the batch
             self.process_batch(
                 batch=expansions_batch,
@@ -427,22 +497,16 @@ class MetadataManager(QObject):
             logger.info(
                 "Finished querying Official expansions. Supplementing metadata..."
             )
-            # Create a packageid to appid mapping for quicker lookup
-            package_to_app = {
-                dlc["packageid"]: appid for appid, dlc in RIMWORLD_DLC_METADATA.items()
-            }
+            # Default for supported versions if not already present
+            default_versions = {"li": ".".join(self.game_version.split(".")[:2])}
             # Base game and expansion About.xml do not contain name, so these
-            # must be manually added
-            for metadata in self.internal_local_metadata.values():
-                package_id = metadata["packageid"]
-                appid = package_to_app.get(package_id)
-                if appid:
-                    dlc_metadata = RIMWORLD_DLC_METADATA[appid]
-                    # Default for supported versions if not already present
-                    default_versions = {
-                        "li": ".".join(self.game_version.split(".")[:2])
-                    }
-                    # Update metadata efficiently
+            # must be manually added. Only visit the mods that carry a DLC
+            # packageid rather than sweeping all metadata
+            for appid, dlc_metadata in RIMWORLD_DLC_METADATA.items():
+                for uuid in self.packageid_to_uuids.get(dlc_metadata["packageid"], ()):
+                    metadata = self.internal_local_metadata.get(uuid)
+                    if metadata is None:
+                        continue
                     metadata.update(
                         {
                             "appid": appid,
@@ -450,7 +514,7 @@ class MetadataManager(QObject):
                             "steam_url": dlc_metadata["steam_url"],
                             "description": dlc_metadata["description"],
                             "supportedversions": metadata.get(
-                                "supportedversions", default_versions
+                                "supportedversions", dict(default_versions)
                             ),
                         }
                     )
@@ -461,18 +525,14 @@ class MetadataManager(QObject):
             # Check for and purge any found expansion metadata from cache
             purge_by_data_source("expansion")
         # Get and cache installed local/SteamCMD Workshop mods
-        current_instance = self.settings_controller.settings.current_instance
-        local_folder = self.settings_controller.settings.instances[
-            current_instance
-        ].local_folder
-        if local_folder and local_folder != "":
+        if local_folder:
             # Get mod data
             logger.info(f"Querying local mods from path: {local_folder}")
-            local_subdirectories = directories(local_folder)
+            local_subdirectories = subdirectories[local_folder]
             local_batch = batch_by_data_source("local", local_subdirectories)
             if not is_initial:
                 # Pop any uuids from metadata that are not in the batch - these can be leftover from a previous directory
-                purge_by_data_source("local", list(local_batch.values()))
+                purge_by_data_source("local", local_batch.values())
             # Query the batch
             self.process_batch(
                 batch=local_batch,
@@ -485,17 +545,13 @@ class MetadataManager(QObject):
             # Check for and purge any found local mod metadata from cache
             purge_by_data_source("local")
         # Get and cache installed Steam client Workshop mods
-        current_instance = self.settings_controller.settings.current_instance
-        workshop_folder = self.settings_controller.settings.instances[
-            current_instance
-        ].workshop_folder
-        if workshop_folder and workshop_folder != "":
+        if workshop_folder:
             logger.info(f"Querying workshop mods from path: {workshop_folder}")
-            workshop_subdirectories = directories(workshop_folder)
+            workshop_subdirectories = subdirectories[workshop_folder]
             workshop_batch = batch_by_data_source("workshop", workshop_subdirectories)
             if not is_initial:
                 # Pop any uuids from metadata that are not in the batch - these can be leftover from a previous directory
-                purge_by_data_source("workshop", list(workshop_batch.values()))
+                purge_by_data_source("workshop", workshop_batch.values())
             # Query the batch
             self.process_batch(
                 batch=workshop_batch,
@@ -510,25 +566,17 @@ class MetadataManager(QObject):
         # Wait for pool to complete
         self.parser_threadpool.waitForDone()
         self.parser_threadpool.clear()
-        # Generate our file <-> UUID mappers for Watchdog and friends
-        # Map mod uuid to metadata file path
-        self.mod_metadata_file_mapper = {
-            **{
-                metadata.get(
-                    "metadata_file_path"
-                ): uuid  # We watch the mod's parent directory for changes, so we need to map to the mod's uuid
-                for uuid, metadata in self.internal_local_metadata.items()
-            },
-        }
-        # Map mod uuid to mod dir path
-        self.mod_metadata_dir_mapper = {
-            **{
-                metadata.get(
-                    "path"
-                ): uuid  # We watch the mod's parent directory for changes, so we need to map to the mod's uuid
-                for uuid, metadata in self.internal_local_metadata.items()
-            },
-        }
+        # Generate our file <-> UUID mappers for Watchdog and friends. We watch
+        # the mod's parent directory for changes, so both map to the mod's uuid
+        file_mapper: dict[str, str] = {}
+        dir_mapper: dict[str, str] = {}
+        for uuid, metadata in self.internal_local_metadata.items():
+            # Map mod metadata file path to mod uuid
+            file_mapper[metadata.get("metadata_file_path")] = uuid
+            # Map mod dir path to mod uuid
+            dir_mapper[metadata.get("path")] = uuid
+        self.mod_metadata_file_mapper = file_mapper
+        self.mod_metadata_dir_mapper = dir_mapper
 
     def __update_from_settings(self) -> None:
         self.community_rules_repo = (
@@ -559,28 +607,29 @@ class MetadataManager(QObject):
         uuids = uuids or list(self.internal_local_metadata.keys())
         logger.info(f"Started compiling metadata for {len(uuids)} mods")
 
+        # The byversion tags are matched against the game's major.minor version,
+        # which is the same for every mod, so the prefix is built once here
+        major, minor = (self.game_version.split(".") + [""])[:2]
+        version_prefix = f"v{major}.{minor}"
+
+        # Bind the hot lookups locally, they are used for every mod below
+        internal_local_metadata = self.internal_local_metadata
+        packageid_to_uuids = self.packageid_to_uuids
+
         # Add dependencies to installed mods based on dependencies listed in About.xml TODO manifest.xml
         logger.info("Started compiling metadata from About.xml")
         for uuid in uuids:
-            logger.debug(
-                f"UUID: {uuid} packageid: "
-                + self.internal_local_metadata[uuid].get("packageid")
-            )
+            mod_metadata = internal_local_metadata[uuid]
+            logger.debug(f"UUID: {uuid} packageid: " + mod_metadata.get("packageid"))
             # moddependencies are not equal to mod load order rules
-            if self.internal_local_metadata[uuid].get("moddependencies"):
-                if isinstance(
-                    self.internal_local_metadata[uuid]["moddependencies"], dict
-                ):
-                    dependencies = self.internal_local_metadata[uuid][
-                        "moddependencies"
-                    ].get("li")
-                elif isinstance(
-                    self.internal_local_metadata[uuid]["moddependencies"], list
-                ):
+            mod_dependencies = mod_metadata.get("moddependencies")
+            if mod_dependencies:
+                dependencies = None
+                if isinstance(mod_dependencies, dict):
+                    dependencies = mod_dependencies.get("li")
+                elif isinstance(mod_dependencies, list):
                     # Loop through the list and try to find dictionary. If we find one, use it.
-                    for potential_dependencies in self.internal_local_metadata[uuid][
-                        "moddependencies"
-                    ]:
+                    for potential_dependencies in mod_dependencies:
                         if (
                             potential_dependencies
                             and isinstance(potential_dependencies, dict)
@@ -592,20 +641,13 @@ class MetadataManager(QObject):
                         f"Current mod requires these mods to work: {dependencies}"
                     )
                     add_dependency_to_mod(
-                        self.internal_local_metadata[uuid],
-                        dependencies,
-                        self.internal_local_metadata,
+                        mod_metadata, dependencies, internal_local_metadata
                     )
 
-            if self.internal_local_metadata[uuid].get("moddependenciesbyversion"):
-                major, minor = self.game_version.split(".")[
-                    :2
-                ]  # Split the version and take the first two parts
-                version_regex = rf"v{major}\.{minor}"  # Construct the regex to match both major and minor versions
-                for version, dependencies_by_ver in self.internal_local_metadata[uuid][
-                    "moddependenciesbyversion"
-                ].items():
-                    if match(version_regex, version):
+            dependencies_by_version = mod_metadata.get("moddependenciesbyversion")
+            if dependencies_by_version and isinstance(dependencies_by_version, dict):
+                for version, dependencies_by_ver in dependencies_by_version.items():
+                    if version.startswith(version_prefix):
                         if (
                             dependencies_by_ver
                             and isinstance(dependencies_by_ver, dict)
@@ -615,42 +657,36 @@ class MetadataManager(QObject):
                                 f"Current mod requires these mods by version to work: {dependencies_by_ver['li']}"
                             )
                             add_dependency_to_mod(
-                                self.internal_local_metadata[uuid],
+                                mod_metadata,
                                 dependencies_by_ver["li"],
-                                self.internal_local_metadata,
+                                internal_local_metadata,
                             )
                         else:
                             logger.warning(
-                                f"About.xml syntax error. Unable to read <moddependenciesbyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
+                                f"About.xml syntax error. Unable to read <moddependenciesbyversion> tag from XML for version [{version}]: {mod_metadata['metadata_file_path']}"
                             )
                             logger.debug(dependencies_by_ver)
-            if self.internal_local_metadata[uuid].get(
-                "incompatiblewith"
-            ) and isinstance(
-                self.internal_local_metadata[uuid].get("incompatiblewith"), dict
-            ):
-                incompatibilities = self.internal_local_metadata[uuid][
-                    "incompatiblewith"
-                ].get("li")
+
+            incompatible_with = mod_metadata.get("incompatiblewith")
+            if incompatible_with and isinstance(incompatible_with, dict):
+                incompatibilities = incompatible_with.get("li")
                 if incompatibilities:
                     logger.debug(
                         f"Current mod is incompatible with these mods: {incompatibilities}"
                     )
                     add_incompatibility_to_mod(
-                        self.internal_local_metadata[uuid],
-                        incompatibilities,
-                        self.internal_local_metadata,
+                        mod_metadata, incompatibilities, packageid_to_uuids
                     )
 
-            if self.internal_local_metadata[uuid].get("incompatiblewithbyversion"):
-                major, minor = self.game_version.split(".")[
-                    :2
-                ]  # Split the version and take the first two parts
-                version_regex = rf"v{major}\.{minor}"  # Construct the regex to match both major and minor versions
-                for version, incompatibilities_by_ver in self.internal_local_metadata[
-                    uuid
-                ]["incompatiblewithbyversion"].items():
-                    if match(version_regex, version):
+            incompatible_with_by_version = mod_metadata.get("incompatiblewithbyversion")
+            if incompatible_with_by_version and isinstance(
+                incompatible_with_by_version, dict
+            ):
+                for (
+                    version,
+                    incompatibilities_by_ver,
+                ) in incompatible_with_by_version.items():
+                    if version.startswith(version_prefix):
                         if (
                             incompatibilities_by_ver
                             and isinstance(incompatibilities_by_ver, dict)
@@ -660,200 +696,76 @@ class MetadataManager(QObject):
                                 f"Current mod is incompatible by version with these mods: {incompatibilities_by_ver['li']}"
                             )
                             add_incompatibility_to_mod(
-                                self.internal_local_metadata[uuid],
+                                mod_metadata,
                                 incompatibilities_by_ver["li"],
-                                self.internal_local_metadata,
+                                packageid_to_uuids,
                             )
                         else:
                             logger.warning(
-                                f"About.xml syntax error. Unable to read <incompatiblewithbyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
+                                f"About.xml syntax error. Unable to read <incompatiblewithbyversion> tag from XML for version [{version}]: {mod_metadata['metadata_file_path']}"
                             )
                             logger.debug(incompatibilities_by_ver)
-            # Current mod should be loaded AFTER these mods. These mods can be thought
-            # of as "load these before". These are not necessarily dependencies in the sense
-            # that they "depend" on them. But, if they exist in the same mod list, they
-            # should be loaded before.
-            if self.internal_local_metadata[uuid].get("loadafter"):
+            # Current mod should be loaded AFTER the mods in <loadafter> and BEFORE
+            # the mods in <loadbefore>. These are not necessarily dependencies in the
+            # sense that they "depend" on them. But, if they exist in the same mod
+            # list, they should be ordered accordingly.
+            for tag, explicit_key, indirect_key in self._LOAD_ORDER_TAGS:
+                if not mod_metadata.get(tag):
+                    continue
                 try:
-                    load_these_before = self.internal_local_metadata[uuid][
-                        "loadafter"
-                    ].get("li")
-                    if load_these_before:
+                    load_order_rules = mod_metadata[tag].get("li")
+                    if load_order_rules:
                         logger.debug(
-                            f"Current mod should load after these mods: {load_these_before}"
+                            f"Current mod has these <{tag}> rules: {load_order_rules}"
                         )
                         add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            load_these_before,
-                            "loadTheseBefore",
-                            "loadTheseAfter",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
+                            mod_metadata,
+                            load_order_rules,
+                            explicit_key,
+                            indirect_key,
+                            internal_local_metadata,
+                            packageid_to_uuids,
                         )
                 except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "metadata_file_path"
-                    ]
                     logger.warning(
-                        f"About.xml syntax error. Unable to read <loadafter> tag from XML: {mod_metadata_path}"
+                        f"About.xml syntax error. Unable to read <{tag}> tag from XML: {mod_metadata.get('metadata_file_path')}"
                     )
                     logger.debug(e)
 
-            if self.internal_local_metadata[uuid].get("forceloadafter"):
-                try:
-                    force_load_these_before = self.internal_local_metadata[uuid][
-                        "forceloadafter"
-                    ].get("li")
-                    if force_load_these_before:
-                        logger.debug(
-                            f"Current mod should force load after these mods: {force_load_these_before}"
-                        )
-                        add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            force_load_these_before,
-                            "loadTheseBefore",
-                            "loadTheseAfter",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
-                        )
-                except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "mod_metadata_path"
-                    ]
-                    logger.warning(
-                        f"About.xml syntax error. Unable to read <forceloadafter> tag from XML: {mod_metadata_path}"
-                    )
-                    logger.debug(e)
-
-            if self.internal_local_metadata[uuid].get("loadafterbyversion"):
-                major, minor = self.game_version.split(".")[:2]
-                version_regex = rf"v{major}\.{minor}"
-                for version, load_these_before_by_ver in self.internal_local_metadata[
-                    uuid
-                ]["loadafterbyversion"].items():
-                    if match(version_regex, version):
-                        try:
-                            if (
-                                load_these_before_by_ver
-                                and isinstance(load_these_before_by_ver, dict)
-                                and load_these_before_by_ver.get("li")
-                            ):
-                                logger.debug(
-                                    f"Current mod should load before these mods for {version}: {load_these_before_by_ver['li']}"
-                                )
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[uuid],
-                                    load_these_before_by_ver["li"],
-                                    "loadTheseBefore",
-                                    "loadTheseAfter",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                            else:
-                                logger.warning(
-                                    f"About.xml syntax error. Unable to read <loadafterbyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
-                                )
-                                logger.debug(load_these_before_by_ver)
-                        except Exception as e:
-                            mod_metadata_path = self.internal_local_metadata[uuid].get(
-                                "metadata_file_path"
+            for tag, explicit_key, indirect_key in self._LOAD_ORDER_BY_VERSION_TAGS:
+                rules_by_version = mod_metadata.get(tag)
+                if not rules_by_version or not isinstance(rules_by_version, dict):
+                    continue
+                for version, load_order_rules_by_ver in rules_by_version.items():
+                    if not version.startswith(version_prefix):
+                        continue
+                    try:
+                        if (
+                            load_order_rules_by_ver
+                            and isinstance(load_order_rules_by_ver, dict)
+                            and load_order_rules_by_ver.get("li")
+                        ):
+                            logger.debug(
+                                f"Current mod has these <{tag}> rules for {version}: {load_order_rules_by_ver['li']}"
                             )
-                            logger.warning(
-                                f"Error processing <loadafterbyversion> tag for {version} from XML: {mod_metadata_path}"
-                            )
-                            logger.debug(e)
-
-            # Current mod should be loaded BEFORE these mods
-            # The current mod is a dependency for all these mods
-            if self.internal_local_metadata[uuid].get("loadbefore"):
-                try:
-                    load_these_after = self.internal_local_metadata[uuid][
-                        "loadbefore"
-                    ].get("li")
-                    if load_these_after:
-                        logger.debug(
-                            f"Current mod should load before these mods: {load_these_after}"
-                        )
-                        add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            load_these_after,
-                            "loadTheseAfter",
-                            "loadTheseBefore",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
-                        )
-                except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "metadata_file_path"
-                    ]
-                    logger.warning(
-                        f"About.xml syntax error. Unable to read <loadbefore> tag from XML: {mod_metadata_path}"
-                    )
-                    logger.debug(e)
-
-            if self.internal_local_metadata[uuid].get("forceloadbefore"):
-                try:
-                    force_load_these_after = self.internal_local_metadata[uuid][
-                        "forceloadbefore"
-                    ].get("li")
-                    if force_load_these_after:
-                        logger.debug(
-                            f"Current mod should force load before these mods: {force_load_these_after}"
-                        )
-                        add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            force_load_these_after,
-                            "loadTheseAfter",
-                            "loadTheseBefore",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
-                        )
-                except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "metadata_file_path"
-                    ]
-                    logger.warning(
-                        f"About.xml syntax error. Unable to read <forceloadbefore> tag from XML: {mod_metadata_path}"
-                    )
-                    logger.debug(e)
-
-            if self.internal_local_metadata[uuid].get("loadbeforebyversion"):
-                major, minor = self.game_version.split(".")[:2]
-                version_regex = rf"v{major}\.{minor}"
-                for version, load_these_after_by_ver in self.internal_local_metadata[
-                    uuid
-                ]["loadbeforebyversion"].items():
-                    if match(version_regex, version):
-                        try:
-                            if (
-                                load_these_after_by_ver
-                                and isinstance(load_these_after_by_ver, dict)
-                                and load_these_after_by_ver.get("li")
-                            ):
-                                logger.debug(
-                                    f"Current mod should load after these mods for {version}: {load_these_after_by_ver['li']}"
-                                )
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[uuid],
-                                    load_these_after_by_ver["li"],
-                                    "loadTheseAfter",
-                                    "loadTheseBefore",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                            else:
-                                logger.warning(
-                                    f"About.xml syntax error. Unable to read <loadbeforebyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
-                                )
-                                logger.debug(load_these_after_by_ver)
-                        except Exception as e:
-                            mod_metadata_path = self.internal_local_metadata[uuid].get(
-                                "metadata_file_path"
+                            add_load_rule_to_mod(
+                                mod_metadata,
+                                load_order_rules_by_ver["li"],
+                                explicit_key,
+                                indirect_key,
+                                internal_local_metadata,
+                                packageid_to_uuids,
                             )
+                        else:
                             logger.warning(
-                                f"Error processing <loadbeforebyversion> tag for {version} from XML: {mod_metadata_path}"
+                                f"About.xml syntax error. Unable to read <{tag}> tag from XML for version [{version}]: {mod_metadata.get('metadata_file_path')}"
                             )
-                            logger.debug(e)
+                            logger.debug(load_order_rules_by_ver)
+                    except Exception as e:
+                        logger.warning(
+                            f"Error processing <{tag}> tag for {version} from XML: {mod_metadata.get('metadata_file_path')}"
+                        )
+                        logger.debug(e)
 
         logger.info("Finished adding dependencies through About.xml information")
         log_deps_order_info(self.internal_local_metadata)
@@ -861,200 +773,101 @@ class MetadataManager(QObject):
         # Steam references dependencies based on PublishedFileID, not package ID
         if self.external_steam_metadata:
             logger.info("Started compiling metadata from configured SteamDB")
-            tracking_dict: dict[str, set[str]] = {}
-            steam_id_to_package_id: dict[str, str] = {}
-            for publishedfileid, mod_data in self.external_steam_metadata.items():
-                db_packageid = mod_data.get("packageid")
-                # If our DB has a packageid for this
-                if db_packageid:
-                    db_packageid = db_packageid.lower()  # Normalize packageid
-                    steam_id_to_package_id[publishedfileid] = db_packageid
-                    self.steamdb_packageid_to_name[db_packageid] = mod_data.get("name")
-                    potential_uuids = self.packageid_to_uuids.get(db_packageid)
-                    if potential_uuids:  # Potential uuids is a set
-                        for uuid in potential_uuids:
-                            if (
-                                uuid
-                                and self.internal_local_metadata[uuid].get(
-                                    "publishedfileid"
-                                )
-                                == publishedfileid
-                            ):
-                                dependencies = mod_data.get("dependencies")
-                                if dependencies:
-                                    tracking_dict.setdefault(uuid, set()).update(
-                                        dependencies.keys()
-                                    )
+            # SteamDB PublishedFileID -> normalized packageid, built when the DB is loaded
+            steam_id_to_package_id = self.steamdb_pfid_to_packageid
+            # Index installed mods by PublishedFileID, so only SteamDB entries for
+            # installed mods are visited
+            pfid_to_uuids: dict[str, list[str]] = {}
+            for uuid, metadata in self.internal_local_metadata.items():
+                if installed_pfid := metadata.get("publishedfileid"):
+                    pfid_to_uuids.setdefault(installed_pfid, []).append(uuid)
             logger.debug(
                 f"Tracking {len(steam_id_to_package_id)} SteamDB packageids for lookup"
             )
-            logger.debug(
-                f"Tracking Steam dependency data for {len(tracking_dict)} installed mods"
-            )
-            # For each mod that exists in self.internal_local_metadata -> dependencies (in Steam ID form)
-            for (
-                installed_mod_uuid,
-                set_of_dependency_publishedfileids,
-            ) in tracking_dict.items():
-                for dependency_steam_id in set_of_dependency_publishedfileids:
-                    # Dependencies are added as package_ids. We should be able to
-                    # resolve the package_id from the Steam ID for any mod, unless
-                    # the metadata actually references a Steam ID that itself does not
-                    # wire to a package_id defined in an installed & valid mod.
-                    if dependency_steam_id in steam_id_to_package_id:
-                        add_dependency_to_mod_from_steamdb(
-                            self.internal_local_metadata[installed_mod_uuid],
-                            steam_id_to_package_id[dependency_steam_id],
-                            self.internal_local_metadata,
-                        )
-                    else:
-                        # This should only happen with RimPy Mod Manager Database, since it does not contain
-                        # keyed information for Core + DLCs in it's ["database"] - this is only referenced by
-                        # RPMMDB with the ["database"][pfid]["children"] values.
-                        logger.debug(
-                            f"Unable to lookup Steam AppID/PublishedFileID in Steam metadata: {dependency_steam_id}"
-                        )
+            for publishedfileid, installed_uuids in pfid_to_uuids.items():
+                db_packageid = steam_id_to_package_id.get(publishedfileid)
+                # If our DB has a packageid for this
+                if not db_packageid:
+                    continue
+                dependencies = self.external_steam_metadata[publishedfileid].get(
+                    "dependencies"
+                )
+                if not dependencies:
+                    continue
+                # Only installed mods that also carry the DB's packageid
+                packageid_uuids = self.packageid_to_uuids.get(db_packageid, ())
+                for uuid in installed_uuids:
+                    if uuid not in packageid_uuids:
+                        continue
+                    for dependency_steam_id in dependencies:
+                        # Dependencies are added as package_ids. We should be able to
+                        # resolve the package_id from the Steam ID for any mod, unless
+                        # the metadata actually references a Steam ID that itself does not
+                        # wire to a package_id defined in an installed & valid mod.
+                        if dependency_steam_id in steam_id_to_package_id:
+                            add_dependency_to_mod_from_steamdb(
+                                self.internal_local_metadata[uuid],
+                                steam_id_to_package_id[dependency_steam_id],
+                                self.internal_local_metadata,
+                            )
+                        else:
+                            # This should only happen with RimPy Mod Manager Database, since it does not contain
+                            # keyed information for Core + DLCs in it's ["database"] - this is only referenced by
+                            # RPMMDB with the ["database"][pfid]["children"] values.
+                            logger.debug(
+                                f"Unable to lookup Steam AppID/PublishedFileID in Steam metadata: {dependency_steam_id}"
+                            )
             logger.info("Finished adding dependencies from SteamDB")
             log_deps_order_info(self.internal_local_metadata)
         else:
             logger.info("No Steam database supplied from external metadata. skipping.")
-        # Add load order to installed mods based on dependencies from community rules
-        if self.external_community_rules:
-            logger.info("Started compiling metadata from configured Community Rules")
-            for package_id in self.external_community_rules:
+        # Add load order rules to installed mods based on rules from community rules
+        # and user rules. Both databases share the same schema
+        for rules_name, rules in (
+            ("Community Rules", self.external_community_rules),
+            ("User Rules", self.external_user_rules),
+        ):
+            if not rules:
+                logger.info(
+                    f"No {rules_name} database supplied from external metadata. skipping."
+                )
+                continue
+            logger.info(f"Started compiling metadata from {rules_name}")
+            for package_id, rule_data in rules.items():
                 # Note: requiring the package be in self.internal_local_metadata should be fine, as
                 # if the mod doesn't exist self.internal_local_metadata, then either mod_data or dependency_id
                 # will be None, and then we don't insert a dependency
-                if package_id.lower() in self.packageid_to_uuids:
-                    potential_uuids = self.packageid_to_uuids.get(
-                        package_id.lower(), set()
-                    )
-                    load_these_after = self.external_community_rules[package_id].get(
-                        "loadBefore"
-                    )
-                    if load_these_after:
-                        logger.debug(
-                            f"Current mod should load before these mods: {load_these_after}"
-                        )
-                        # In Alphabetical, load_these_after is at least an empty dict
-                        # Cannot call add_load_rule_to_mod outside of this for loop,
-                        # as that expects a list
-                        for load_this_after in load_these_after:
-                            for uuid in potential_uuids:
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[
-                                        uuid
-                                    ],  # Already checked above
-                                    load_this_after,  # Lower() done in call
-                                    "loadTheseAfter",
-                                    "loadTheseBefore",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                    load_these_before = self.external_community_rules[package_id].get(
-                        "loadAfter"
-                    )
-                    if load_these_before:
-                        logger.debug(
-                            f"Current mod should load after these mods: {load_these_before}"
-                        )
-                        # In Alphabetical, load_these_before is at least an empty dict
-                        for load_this_before in load_these_before:
-                            for uuid in potential_uuids:
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[
-                                        uuid
-                                    ],  # Already checked above
-                                    load_this_before,  # lower() done in call
-                                    "loadTheseBefore",
-                                    "loadTheseAfter",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                    load_this_bottom = self.external_community_rules[package_id].get(
-                        "loadBottom"
+                potential_uuids = packageid_to_uuids.get(package_id.lower())
+                if not potential_uuids:
+                    continue
+                for rule_key, explicit_key, indirect_key in self._EXTERNAL_RULE_KEYS:
+                    load_order_rules = rule_data.get(rule_key)
+                    if not load_order_rules:
+                        continue
+                    logger.debug(
+                        f"Current mod has these {rule_key} rules: {load_order_rules}"
                     )
-                    if load_this_bottom:
-                        logger.debug(
-                            'Current mod should load at the bottom of a mods list, and will be considered a "tier 3" mod'
-                        )
+                    # In Alphabetical, load_order_rules is at least an empty dict.
+                    # add_load_rule_to_mod expects ids rather than a dict, so it
+                    # is called per rule
+                    for load_order_rule in load_order_rules:
                         for uuid in potential_uuids:
-                            self.internal_local_metadata[uuid]["loadBottom"] = True
-            logger.info("Finished adding dependencies from Community Rules")
-            log_deps_order_info(self.internal_local_metadata)
-        else:
-            logger.info(
-                "No Community Rules database supplied from external metadata. skipping."
-            )
-        # Add load order rules to installed mods based on rules from user rules
-        if self.external_user_rules:
-            logger.info("Started compiling metadata from User Rules")
-            for package_id in self.external_user_rules:
-                # Note: requiring the package be in self.internal_local_metadata should be fine, as
-                # if the mod doesn't exist self.internal_local_metadata, then either mod_data or dependency_id
-                # will be None, and then we don't insert a dependency
-                if package_id.lower() in self.packageid_to_uuids:
-                    potential_uuids = self.packageid_to_uuids.get(
-                        package_id.lower(), set()
-                    )
-                    load_these_after = self.external_user_rules[package_id].get(
-                        "loadBefore"
-                    )
-                    if load_these_after:
-                        logger.debug(
-                            f"Current mod should load before these mods: {load_these_after}"
-                        )
-                        # In Alphabetical, load_these_after is at least an empty dict
-                        # Cannot call add_load_rule_to_mod outside of this for loop,
-                        # as that expects a list
-                        for load_this_after in load_these_after:
-                            for uuid in potential_uuids:
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[
-                                        uuid
-                                    ],  # Already checked above
-                                    load_this_after,  # lower() done in call
-                                    "loadTheseAfter",
-                                    "loadTheseBefore",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-
-                    load_these_before = self.external_user_rules[package_id].get(
-                        "loadAfter"
-                    )
-                    if load_these_before:
-                        logger.debug(
-                            f"Current mod should load after these mods: {load_these_before}"
-                        )
-                        # In Alphabetical, load_these_before is at least an empty dict
-                        for load_this_before in load_these_before:
-                            for uuid in potential_uuids:
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[
-                                        uuid
-                                    ],  # Already checked above
-                                    load_this_before,  # lower() done in call
-                                    "loadTheseBefore",
-                                    "loadTheseAfter",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                    load_this_bottom = self.external_user_rules[package_id].get(
-                        "loadBottom"
+                            add_load_rule_to_mod(
+                                internal_local_metadata[uuid],
+                                load_order_rule,  # lower() done in call
+                                explicit_key,
+                                indirect_key,
+                                internal_local_metadata,
+                                packageid_to_uuids,
+                            )
+                if rule_data.get("loadBottom"):
+                    logger.debug(
+                        'Current mod should load at the bottom of a mods list, and will be considered a "tier 3" mod'
                     )
-                    if load_this_bottom:
-                        logger.debug(
-                            'Current mod should load at the bottom of a mods list, and will be considered a "tier 3" mod'
-                        )
-                        for uuid in potential_uuids:
-                            self.internal_local_metadata[uuid]["loadBottom"] = True
-            logger.info("Finished adding dependencies from User Rules")
-            log_deps_order_info(self.internal_local_metadata)
-        else:
-            logger.info(
-                "No User Rules database supplied from external metadata. skipping."
-            )
+                    for uuid in potential_uuids:
+                        internal_local_metadata[uuid]["loadBottom"] = True
+            logger.info(f"Finished adding dependencies from {rules_name}")
+            log_deps_order_info(internal_local_metadata)
         logger.info("Finished compiling internal metadata with external metadata")
 
     def is_version_mismatch(self, uuid: str) -> bool:
@@ -1077,9 +890,7 @@ class MetadataManager(QObject):
             and mod_data.get("supportedversions", {}).get("li")
         ):
             # Get supported versions
-            supported_versions = self.internal_local_metadata[uuid][
-                "supportedversions"
-            ]["li"]
+            supported_versions = mod_data["supportedversions"]["li"]
 
             # Check if supported versions is a string or a list
             if isinstance(supported_versions, str):
@@ -1087,14 +898,8 @@ class MetadataManager(QObject):
                 if self.game_version.startswith(supported_versions):
                     result = False
             elif isinstance(supported_versions, list):
-                # If any version from supported_versions starts with game_version, result is False
-                result = not any(
-                    [
-                        ver
-                        for ver in supported_versions
-                        if self.game_version.startswith(ver)
-                    ]
-                )
+                # If game_version starts with any of supported_versions, result is False
+                result = not self.game_version.startswith(tuple(supported_versions))
             else:
                 # If supported_versions is not a string or a list, log error and return True
                 logger.error(
@@ -1182,7 +987,9 @@ class MetadataManager(QObject):
         # ...Steam client
         if steamclient and os.path.exists(self.workshop_acf_path):
             try:
-                self.workshop_acf_data = acf_to_dict(self.workshop_acf_path)
+                self.workshop_acf_data = self.__load_cached(
+                    "Steam client .acf", self.workshop_acf_path, acf_to_dict
+                )
                 logger.info(
                     f"Successfully parsed Steam client appworkshop.acf metadata from: {self.workshop_acf_path}"
                 )
@@ -1195,8 +1002,10 @@ class MetadataManager(QObject):
             self.steamcmd_wrapper.steamcmd_appworkshop_acf_path
         ):
             try:
-                self.steamcmd_acf_data = acf_to_dict(
-                    self.steamcmd_wrapper.steamcmd_appworkshop_acf_path
+                self.steamcmd_acf_data = self.__load_cached(
+                    "SteamCMD .acf",
+                    self.steamcmd_wrapper.steamcmd_appworkshop_acf_path,
+                    acf_to_dict,
                 )
                 logger.info(
                     f"Successfully parsed SteamCMD appworkshop.acf metadata from: {self.steamcmd_wrapper.steamcmd_appworkshop_acf_path}"
@@ -1331,6 +1140,8 @@ class ModParser(QRunnable):
                 about_folder_name = temp_file.name
                 invalid_about_folder_path_found = False
                 break
+        # Stat the mod folder once, its mtime is used by whichever entry gets populated
+        mod_directory_mtime = int(os.stat(mod_directory).st_mtime)
         # Look for a case-insensitive "About.xml" file
         invalid_about_file_path_found = True
         if not invalid_about_folder_path_found:
@@ -1341,6 +1152,7 @@ class ModParser(QRunnable):
                     and temp_file.is_file()
                 ):
                     about_file_name = temp_file.name
+                    about_file_entry = temp_file
                     invalid_about_file_path_found = False
                     break
         # Look for .rsc scenario files to load metadata from if we didn't find About.xml
@@ -1349,6 +1161,7 @@ class ModParser(QRunnable):
             for temp_file in os.scandir(mod_directory):
                 if temp_file.name.lower().endswith(".rsc") and not temp_file.is_dir():
                     scenario_rsc_file = temp_file.name
+                    scenario_rsc_entry = temp_file
                     scenario_rsc_found = True
                     break
         # If a mod's folder name is a valid PublishedFileId in SteamDB
@@ -1508,15 +1321,11 @@ class ModParser(QRunnable):
                         mod_metadata["steam_uri"] = (
                             f"steam://url/CommunityFilePage/{pfid}"
                         )
-                        mod_metadata["steam_url"] = (
-                            f"https://steamcommunity.com/sharedfiles/filedetails/?id={pfid}"
-                        )
+                        mod_metadata["steam_url"] = f"{BASE_URL_STEAMFILES}{pfid}"
                     # If a mod contains C# assemblies, we want to tag the mod
                     assemblies_path = str(directory_path / "Assemblies")
                     # Check if the 'Assemblies' directory exists and is a directory
-                    if os.path.exists(assemblies_path) and os.path.isdir(
-                        assemblies_path
-                    ):
+                    if os.path.isdir(assemblies_path):
                         try:
                             # Check if there are any .dll files in the 'Assemblies' directory
                             if any(
@@ -1531,16 +1340,16 @@ class ModParser(QRunnable):
                                 f"Failed to list directory {assemblies_path}: {e}"
                             )
                     else:
-                        # If no 'Assemblies' directory in the main folder, check in subfolders
-                        subfolder_paths = [
-                            str(directory_path / folder)
-                            for folder in os.listdir(mod_directory)
-                            if os.path.isdir(str(directory_path / folder))
-                        ]
+                        # If no 'Assemblies' directory in the main folder, check in subfolders.
+                        # scandir reports entry types without a stat per entry
+                        with os.scandir(mod_directory) as entries:
+                            subfolder_paths = [
+                                entry.path for entry in entries if entry.is_dir()
+                            ]
                         for subfolder_path in subfolder_paths:
-                            assemblies_path = str(Path(subfolder_path) / "Assemblies")
+                            assemblies_path = os.path.join(subfolder_path, "Assemblies")
                             # Check if the 'Assemblies' directory exists in the subfolder
-                            if os.path.exists(assemblies_path):
+                            if os.path.isdir(assemblies_path):
                                 # Check if there are any .dll files in this 'Assemblies' directory
                                 if any(
                                     filename.endswith((".dll", ".DLL"))
@@ -1553,12 +1362,11 @@ class ModParser(QRunnable):
                     mod_metadata["data_source"] = data_source
                     mod_metadata["folder"] = directory_name
                     # This is overwritten if acf data is parsed for Steam/SteamCMD mods
-                    mod_metadata["internal_time_touched"] = int(
-                        os.path.getmtime(mod_directory)
-                    )
+                    mod_metadata["internal_time_touched"] = mod_directory_mtime
                     mod_metadata["path"] = mod_directory
+                    # The scandir entry that found the file caches its stat result
                     mod_metadata["metadata_file_mtime"] = int(
-                        os.path.getmtime(mod_data_path)
+                        about_file_entry.stat().st_mtime
                     )
                     mod_metadata["metadata_file_path"] = mod_data_path
                     # Grab our mod's publishedfileid
@@ -1662,20 +1470,16 @@ class ModParser(QRunnable):
                         scenario_metadata["steam_uri"] = (
                             f"steam://url/CommunityFilePage/{pfid}"
                         )
-                        scenario_metadata["steam_url"] = (
-                            f"https://steamcommunity.com/sharedfiles/filedetails/?id={pfid}"
-                        )
+                        scenario_metadata["steam_url"] = f"{BASE_URL_STEAMFILES}{pfid}"
                     # data_source will be used with setIcon later
                     scenario_metadata["data_source"] = data_source
                     scenario_metadata["folder"] = directory_name
                     scenario_metadata["path"] = mod_directory
                     # This is overwritten if acf data is parsed for Steam/SteamCMD mods
-                    scenario_metadata["internal_time_touched"] = int(
-                        os.path.getmtime(mod_directory)
-                    )
+                    scenario_metadata["internal_time_touched"] = mod_directory_mtime
                     scenario_metadata["metadata_file_path"] = scenario_data_path
                     scenario_metadata["metadata_file_mtime"] = int(
-                        os.path.getmtime(scenario_data_path)
+                        scenario_rsc_entry.stat().st_mtime
                     )
                     # Track source & uuid in case metadata becomes detached
                     scenario_metadata["uuid"] = uuid
@@ -1707,7 +1511,7 @@ class ModParser(QRunnable):
                 "folder": directory_name,
                 "path": mod_directory,
                 # This is overwritten if acf data is parsed for Steam/SteamCMD mods
-                "internal_time_touched": int(os.path.getmtime(mod_directory)),
+                "internal_time_touched": mod_directory_mtime,
                 "uuid": uuid,
             }
             if pfid:
@@ -1826,11 +1630,15 @@ def get_num_dependencies(all_mods: dict[str, Any], key_name: str) -> int:
 def add_incompatibility_to_mod(
     mod_data: dict[str, Any],
     dependency_or_dependency_ids: Any,
-    all_mods: dict[str, Any],
+    packageid_to_uuids: dict[str, Any],
 ) -> None:
     """
-    Incompatibility data is collected only if that incompatibility is in `all_mods`.
+    Incompatibility data is collected only if that incompatibility is installed.
     There's no need to surface incompatibilities if they aren't even downloaded.
+
+    :param mod_data: mod data dict to add incompatibilities to
+    :param dependency_or_dependency_ids: either string or list of strings
+    :param packageid_to_uuids: installed packageids, used to verify incompatibilities against
     """
     logger.debug(
         f"Adding incompatibilities for packages [{dependency_or_dependency_ids}] to mod data: {mod_data} (and reverse direction too)"
@@ -1839,22 +1647,26 @@ def add_incompatibility_to_mod(
         # Create a new key with empty set as value by default
         mod_data.setdefault("incompatibilities", set())
 
-        all_package_ids = set(all_mods[uuid]["packageid"] for uuid in all_mods)
-
         # If the value is a single string...
         if isinstance(dependency_or_dependency_ids, str):
             dependency_id = dependency_or_dependency_ids.lower()
-            if dependency_id in all_package_ids:
+            if packageid_to_uuids.get(dependency_id):
                 mod_data["incompatibilities"].add(dependency_id)
 
         # If the value is a LIST of strings
         elif isinstance(dependency_or_dependency_ids, list):
             if isinstance(dependency_or_dependency_ids[0], str):
-                for dependency in dependency_or_dependency_ids:
-                    if dependency:  # Sometimes, this can be None or an empty string if XML syntax error/extra elements
-                        dependency_id = dependency.lower()
-                        if dependency_id in all_package_ids:
-                            mod_data["incompatibilities"].add(dependency_id)
+                # Sometimes, entries can be None or an empty string if XML syntax error/extra elements
+                dependency_ids = {
+                    dependency.lower()
+                    for dependency in dependency_or_dependency_ids
+                    if dependency
+                }
+                mod_data["incompatibilities"].update(
+                    dependency_id
+                    for dependency_id in dependency_ids
+                    if packageid_to_uuids.get(dependency_id)
+                )
             else:
                 logger.error(
                     f"List of incompatibilities does not contain strings: [{dependency_or_dependency_ids}]"
@@ -1916,15 +1728,19 @@ def add_load_rule_to_mod(
         )
         return
 
-    mod_data.setdefault(explicit_key, set())
+    # Only rules for installed mods are kept, so the rule sets are created on
+    # the first one found rather than for every mod
+    explicit_rules = None
+    indirect_rule = (mod_data["packageid"], False)
     for dep in dependencies:
-        if dep in packageid_to_uuids:
-            mod_data[explicit_key].add((dep, True))
-            potential_dep_uuids = packageid_to_uuids[dep]
-            for dep_uuid in potential_dep_uuids:
-                all_mods[dep_uuid].setdefault(indirect_key, set()).add(
-                    (mod_data["packageid"], False)
-                )
+        potential_dep_uuids = packageid_to_uuids.get(dep)
+        if potential_dep_uuids is None:
+            continue
+        if explicit_rules is None:
+            explicit_rules = mod_data.setdefault(explicit_key, set())
+        explicit_rules.add((dep, True))
+        for dep_uuid in potential_dep_uuids:
+            all_mods[dep_uuid].setdefault(indirect_key, set()).add(indirect_rule)
 
 
 def get_mods_from_list(
@@ -1942,38 +1758,36 @@ def get_mods_from_list(
     :return: a tuple which contains the active mods dict, inactive mods dict,
     duplicate mods dict, and missing mods list
     """
-    all_mods = MetadataManager.instance().internal_local_metadata
+    metadata_manager = MetadataManager.instance()
+    all_mods = metadata_manager.internal_local_metadata
 
     active_mods_uuids: list[str] = []
     inactive_mods_uuids: list[str] = []
-    duplicate_mods: dict[str, Any] = {}
-    duplicates_processed = []
+    duplicates_processed: set[str] = set()
     missing_mods: list[str] = []
-    populated_mods = []
-    to_populate = []
+    populated_mods: set[str] = set()
+    to_populate: set[str] = set()
     logger.debug("Started generating active and inactive mods")
-    # Calculate duplicate mods (SCHEMA: {str packageid: list[str duplicate uuids]})
+    # Index installed mods by packageid (SCHEMA: {str packageid: list[str uuids]})
+    packageid_to_uuids: dict[str, list[str]] = {}
     for mod_uuid, mod_data in all_mods.items():
-        # Using setdefault() to initialize the dictionary and then assigning the value
-        duplicate_mods.setdefault(mod_data["packageid"], []).append(mod_uuid)
-    # Filter out non-duplicate mods
-    duplicate_mods = {k: v for k, v in duplicate_mods.items() if len(v) > 1}
+        packageid_to_uuids.setdefault(mod_data["packageid"], []).append(mod_uuid)
+    # Calculate duplicate mods from the packageids with more than one uuid
+    duplicate_mods = {k: v for k, v in packageid_to_uuids.items() if len(v) > 1}
     # Calculate mod lists
     if isinstance(mod_list, str):
         # Handle the mod list not existing
         if not os.path.exists(mod_list):
             logger.debug(f"Could not find mods list at: {mod_list}")
             logger.debug("Creating an empty list with available expansions...")
-            metadata_manager = MetadataManager.instance()
-            game_version = metadata_manager.game_version
             generated_xml = generate_rimworld_mods_list(
-                game_version, ["Ludeon.RimWorld"]
+                metadata_manager.game_version, ["Ludeon.RimWorld"]
             )
             logger.debug(f"Saving new mods list to: {mod_list}")
             json_to_xml_write(generated_xml, mod_list)
         # Parse the ModsConfig.xml activeMods list
         logger.info(f"Retrieving active mods from RimWorld mod list: {mod_list}")
-        mod_data = xml_path_to_json(mod_list)
+        mod_data = mods_list_path_to_json(mod_list)
         package_ids_to_import = validate_rimworld_mods_list(mod_data)
     elif isinstance(mod_list, list):
         logger.info("Retrieving active mods from the provided list of package ids")
@@ -1997,7 +1811,7 @@ def get_mods_from_list(
             else package_id_normalized
         )
         # Append our packageid to list, used to calculate missing mods later
-        to_populate.append(target_id)
+        to_populate.add(target_id)
         sources_order = (
             # Prioritize workshop duplicate if _steam suffix used...
             ["workshop", "local"]
@@ -2005,62 +1819,64 @@ def get_mods_from_list(
             # ... otherwise, we use standard data source priority if suffix not used
             else ["expansion", "local", "workshop"]
         )
-        # Loop through all mods
-        for uuid, metadata in all_mods.items():
-            metadata_package_id = metadata["packageid"]
-            if (
-                metadata_package_id
-                in [  # If we have a match with or without _steam present
-                    package_id_normalized,
-                    package_id_normalized_stripped,
-                ]
-            ):
-                # Add non-duplicates to active mods
-                if target_id not in duplicate_mods.keys():
-                    populated_mods.append(target_id)
-                    active_mods_uuids.append(uuid)
-                else:  # Otherwise, duplicate needs calculated
-                    if (
-                        target_id in duplicates_processed
-                    ):  # Skip duplicates that have already been processed
-                        continue
-                    logger.info(
-                        f"Found duplicate mod present in active mods list: {target_id}"
-                    )
-                    # Loop through sorted paths and determine which duplicate to used based on priority
-                    for source in sources_order:
-                        logger.debug(f"Checking for duplicate with source: {source}")
-                        # Sort duplicate mod paths by source priority
-                        paths_to_uuid = {}
-                        for duplicate_uuid in duplicate_mods[target_id]:
-                            if source in all_mods[duplicate_uuid]["data_source"]:
-                                paths_to_uuid[all_mods[duplicate_uuid]["path"]] = (
-                                    duplicate_uuid
-                                )
-                        # Sort duplicate mod paths from current source priority using natsort
-                        source_paths_sorted = natsorted(paths_to_uuid.keys())
-                        if source_paths_sorted:  # If we have paths returned
-                            # If we are here, we've found our calculated duplicate, log and use this mod
-                            calculated_duplicate_uuid = paths_to_uuid[
-                                source_paths_sorted[0]
-                            ]
-                            logger.debug(
-                                f"Using duplicate {source} mod for {target_id}: {all_mods[calculated_duplicate_uuid]['path']}"
+        # Look up installed mods matching with or without _steam present
+        matching_uuids = packageid_to_uuids.get(package_id_normalized, [])
+        stripped_uuids = (
+            packageid_to_uuids.get(package_id_normalized_stripped) if is_steam else None
+        )
+        if stripped_uuids:
+            if matching_uuids:
+                # Both packageids are installed, keep the installed mods order
+                matching = set(matching_uuids).union(stripped_uuids)
+                matching_uuids = [uuid for uuid in all_mods if uuid in matching]
+            else:
+                matching_uuids = stripped_uuids
+        for uuid in matching_uuids:
+            # Add non-duplicates to active mods
+            if target_id not in duplicate_mods:
+                populated_mods.add(target_id)
+                active_mods_uuids.append(uuid)
+            else:  # Otherwise, duplicate needs calculated
+                if (
+                    target_id in duplicates_processed
+                ):  # Skip duplicates that have already been processed
+                    continue
+                logger.info(
+                    f"Found duplicate mod present in active mods list: {target_id}"
+                )
+                # Loop through sorted paths and determine which duplicate to used based on priority
+                for source in sources_order:
+                    logger.debug(f"Checking for duplicate with source: {source}")
+                    # Sort duplicate mod paths by source priority
+                    paths_to_uuid = {}
+                    for duplicate_uuid in duplicate_mods[target_id]:
+                        if source in all_mods[duplicate_uuid]["data_source"]:
+                            paths_to_uuid[all_mods[duplicate_uuid]["path"]] = (
+                                duplicate_uuid
                             )
-                            populated_mods.append(target_id)
-                            duplicates_processed.append(target_id)
-                            active_mods_uuids.append(calculated_duplicate_uuid)
-                            break
-                        else:  # Skip this source priority if no paths
-                            logger.debug(f"No paths returned for {source}")
-                            continue
+                    if paths_to_uuid:  # If we have paths returned
+                        # Use the first duplicate mod path from current source priority in natural order
+                        calculated_duplicate_uuid = paths_to_uuid[
+                            min(paths_to_uuid, key=_NATSORT_KEY)
+                        ]
+                        logger.debug(
+                            f"Using duplicate {source} mod for {target_id}: {all_mods[calculated_duplicate_uuid]['path']}"
+                        )
+                        populated_mods.add(target_id)
+                        duplicates_processed.add(target_id)
+                        active_mods_uuids.append(calculated_duplicate_uuid)
+                        break
+                    else:  # Skip this source priority if no paths
+                        logger.debug(f"No paths returned for {source}")
+                        continue
     # Calculate missing mods from the difference
-    missing_mods = list(set(to_populate) - set(populated_mods))
+    missing_mods = list(to_populate - populated_mods)
     logger.debug(f"Generated active mods dict with {len(active_mods_uuids)} mods")
     # Get the inactive mods by subtracting active mods from workshop + expansions
     logger.info("Generating inactive mod list")
+    active_mods_uuids_set = set(active_mods_uuids)
     inactive_mods_uuids = [
-        uuid for uuid in all_mods.keys() if uuid not in active_mods_uuids
+        uuid for uuid in all_mods.keys() if uuid not in active_mods_uuids_set
     ]
     logger.info(f"# active mods: {len(active_mods_uuids)}")
     logger.info(f"# inactive mods: {len(inactive_mods_uuids)}")
@@ -2225,65 +2041,51 @@ class SteamDatabaseBuilder(QThread):
             )
 
     def _init_db_from_local_metadata(self) -> dict[str, Any]:
+        appid_entries: dict[str, Any] = {}
+        publishedfileid_entries: dict[str, Any] = {}
+        for v in self.mods.values():
+            appid = v.get("appid")
+            publishedfileid = v.get("publishedfileid")
+            if not appid and not publishedfileid:
+                continue
+            authors = v.get("authors", "Missing XML: <author(s)>")
+            if isinstance(authors, dict) and authors.get("li"):
+                authors = ", ".join(authors["li"])
+            if appid:
+                appid_entries[appid] = {
+                    "appid": True,
+                    "url": f"https://store.steampowered.com/app/{appid}",
+                    "packageId": v.get("packageid"),
+                    "name": v.get("name"),
+                    "authors": authors,
+                }
+            if publishedfileid:
+                supported_versions = v.get("supportedversions")
+                if not supported_versions:
+                    game_versions = [
+                        v.get(
+                            "targetversion",
+                            "Missing XML: <supportedversions> or <targetversion>",
+                        )
+                    ]
+                elif isinstance(supported_versions.get("li"), list):
+                    game_versions = supported_versions["li"]
+                else:
+                    game_versions = [supported_versions.get("li")]
+                publishedfileid_entries[publishedfileid] = {
+                    "url": f"{BASE_URL_STEAMFILES}{publishedfileid}",
+                    "packageId": v.get("packageid"),
+                    "name": (
+                        v.get("name")
+                        if not v.get("DB_BUILDER_NO_NAME")
+                        else "Missing XML: <name>"
+                    ),
+                    "authors": authors,
+                    "gameVersions": game_versions,
+                }
         db_from_local_metadata = {
             "version": 0,
-            "database": {
-                **{
-                    v["appid"]: {
-                        "appid": True,
-                        "url": f'https://store.steampowered.com/app/{v["appid"]}',
-                        "packageId": v.get("packageid"),
-                        "name": v.get("name"),
-                        "authors": (
-                            ", ".join(v.get("authors").get("li"))
-                            if v.get("authors")
-                            and isinstance(v.get("authors"), dict)
-                            and v.get("authors").get("li")
-                            else v.get("authors", "Missing XML: <author(s)>")
-                        ),
-                    }
-                    for v in self.mods.values()
-                    if v.get("appid")
-                },
-                **{
-                    v["publishedfileid"]: {
-                        "url": f'https://steamcommunity.com/sharedfiles/filedetails/?id={v["publishedfileid"]}',
-                        "packageId": v.get("packageid"),
-                        "name": (
-                            v.get("name")
-                            if not v.get("DB_BUILDER_NO_NAME")
-                            else "Missing XML: <name>"
-                        ),
-                        "authors": (
-                            ", ".join(v.get("authors").get("li"))
-                            if v.get("authors")
-                            and isinstance(v.get("authors"), dict)
-                            and v.get("authors").get("li")
-                            else v.get("authors", "Missing XML: <author(s)>")
-                        ),
-                        "gameVersions": (
-                            v.get("supportedversions").get("li")
-                            if isinstance(
-                                v.get("supportedversions", {}).get("li"), list
-                            )
-                            else [
-                                (
-                                    v.get("supportedversions", {}).get(
-                                        "li",
-                                    )
-                                    if v.get("supportedversions")
-                                    else v.get(
-                                        "targetversion",
-                                        "Missing XML: <supportedversions> or <targetversion>",
-                                    )
-                                )
-                            ]
-                        ),
-                    }
-                    for v in self.mods.values()
-                    if v.get("publishedfileid")
-                },
-            },
+            "database": {**appid_entries, **publishedfileid_entries},
         }
         total = (
             len(db_from_local_metadata["database"].keys())
@@ -2299,25 +2101,22 @@ class SteamDatabaseBuilder(QThread):
     def _init_empty_db_from_publishedfileids(
         self, publishedfileids: list[str]
     ) -> dict[str, Any]:
+        entries: dict[str, Any] = {
+            appid: {
+                "appid": True,
+                "url": f"https://store.steampowered.com/app/{appid}",
+                "packageid": metadata.get("packageid"),
+                "name": metadata.get("name"),
+            }
+            for appid, metadata in RIMWORLD_DLC_METADATA.items()
+        }
+        for publishedfileid in publishedfileids:
+            entries[publishedfileid] = {
+                "url": f"{BASE_URL_STEAMFILES}{publishedfileid}"
+            }
         database: dict[str, int | dict[str, Any]] = {
             "version": 0,
-            "database": {
-                **{
-                    appid: {
-                        "appid": True,
-                        "url": f"https://store.steampowered.com/app/{appid}",
-                        "packageid": metadata.get("packageid"),
-                        "name": metadata.get("name"),
-                    }
-                    for appid, metadata in RIMWORLD_DLC_METADATA.items()
-                },
-                **{
-                    publishedfileid: {
-                        "url": f"https://steamcommunity.com/sharedfiles/filedetails/?id={publishedfileid}"
-                    }
-                    for publishedfileid in publishedfileids
-                },
-            },
+            "database": entries,
         }
         total = (
             len(database["database"].keys())
@@ -2331,34 +2130,16 @@ class SteamDatabaseBuilder(QThread):
 
     def _output_database(self, database: dict[str, Any]) -> None:
         # If user-configured `update` parameter, update old db with new query data recursively
-        if self.update and os.path.exists(self.output_database_path):
-            self.db_builder_message_output_signal.emit(
-                f"\nIn-place DB update configured. Existing DB to update:\n{self.output_database_path}"
-            )
-            if self.output_database_path and os.path.exists(self.output_database_path):
-                with open(self.output_database_path, encoding="utf-8") as f:
-                    json_string = f.read()
-                    self.db_builder_message_output_signal.emit(
-                        "\nReading info from file..."
-                    )
-                    db_to_update = json.loads(json_string)
-                    self.db_builder_message_output_signal.emit(
-                        "Retrieved cached database!\n"
-                    )
-                self.db_builder_message_output_signal.emit(
-                    "Recursively updating previous database with new metadata...\n"
-                )
-                recursively_update_dict(
-                    db_to_update,
-                    database,
-                    prune_exceptions=DB_BUILDER_PRUNE_EXCEPTIONS,
-                    recurse_exceptions=DB_BUILDER_RECURSE_EXCEPTIONS,
-                )
-                with open(self.output_database_path, "w", encoding="utf-8") as output:
-                    json.dump(db_to_update, output, indent=4)
-            else:
+        db_to_update = None
+        if self.update:
+            try:
+                db_to_update = decode_json_file(self.output_database_path)
+            except FileNotFoundError:
+                # Nothing to update, the new db is written as is below
+                pass
+            except msgspec.DecodeError:
                 self.db_builder_message_output_signal.emit(
-                    "Unable to load database from specified path! Does the file exist...?"
+                    "Unable to load database from specified path! Is the file valid JSON...?"
                 )
                 appended_path = str(
                     Path(self.output_database_path).parent
@@ -2367,14 +2148,37 @@ class SteamDatabaseBuilder(QThread):
                 self.db_builder_message_output_signal.emit(
                     f"\nCaching DynamicQuery result:\n\n{appended_path}"
                 )
-                with open(appended_path, "w", encoding="utf-8") as output:
-                    json.dump(database, output, indent=4)
+                with open(appended_path, "wb") as output:
+                    output.write(
+                        msgspec.json.format(msgspec.json.encode(database), indent=4)
+                    )
+                return
+        if db_to_update is not None:
+            self.db_builder_message_output_signal.emit(
+                f"\nIn-place DB update configured. Existing DB to update:\n{self.output_database_path}"
+            )
+            self.db_builder_message_output_signal.emit("Retrieved cached database!\n")
+            self.db_builder_message_output_signal.emit(
+                "Recursively updating previous database with new metadata...\n"
+            )
+            recursively_update_dict(
+                db_to_update,
+                database,
+                prune_exceptions=DB_BUILDER_PRUNE_EXCEPTIONS,
+                recurse_exceptions=DB_BUILDER_RECURSE_EXCEPTIONS,
+            )
+            with open(self.output_database_path, "wb") as output:
+                output.write(
+                    msgspec.json.format(msgspec.json.encode(db_to_update), indent=4)
+                )
         else:  # Dump new db to specified path, effectively "overwriting" the db with fresh data
             self.db_builder_message_output_signal.emit(
                 f"\nCaching DynamicQuery result:\n{self.output_database_path}"
             )
-            with open(self.output_database_path, "w", encoding="utf-8") as output:
-                json.dump(database, output, indent=4)
+            with open(self.output_database_path, "wb") as output:
+                output.write(
+                    msgspec.json.format(msgspec.json.encode(database), indent=4)
+                )
 
 
 # Misc helper functions
@@ -2393,26 +2197,21 @@ def check_if_pfids_blacklisted(
     # Warn attempt of blacklisted mods
     blacklisted_mods = {}
     for publishedfileid in publishedfileids:
-        if steamdb.get(publishedfileid, {}).get("blacklist"):
+        entry = steamdb.get(publishedfileid)
+        if not (entry and entry.get("blacklist")):
+            entry = steamdb.get(str(publishedfileid))  # TODO: Is this needed?
+        if entry and entry.get("blacklist"):
             blacklisted_mods[publishedfileid] = {
-                "name": steamdb[publishedfileid]["steamName"],
-                "comment": steamdb[publishedfileid]["blacklist"]["comment"],
-            }
-        elif steamdb.get(str(publishedfileid), {}).get(
-            "blacklist"
-        ):  # TODO: Is this needed?
-            blacklisted_mods[publishedfileid] = {
-                "name": steamdb[str(publishedfileid)]["steamName"],
-                "comment": steamdb[str(publishedfileid)]["blacklist"]["comment"],
+                "name": entry["steamName"],
+                "comment": entry["blacklist"]["comment"],
             }
     # Generate report if we have blacklisted mods found
     if blacklisted_mods:
-        blacklisted_mods_report = ""
-        for publishedfileid in blacklisted_mods:
-            blacklisted_mods_report += (
-                f'{blacklisted_mods[publishedfileid]["name"]} ({publishedfileid})\n'
-            )
-            blacklisted_mods_report += f'Reason for blacklisting: {blacklisted_mods[publishedfileid]["comment"]}'
+        blacklisted_mods_report = "\n".join(
+            f"{blacklisted_mod['name']} ({publishedfileid})\n"
+            + f"Reason for blacklisting: {blacklisted_mod['comment']}"
+            for publishedfileid, blacklisted_mod in blacklisted_mods.items()
+        )
         answer = show_dialogue_conditional(
             title="Blacklisted mods found",
             text="Some mods are blacklisted in your SteamDB",
@@ -2423,11 +2222,15 @@ def check_if_pfids_blacklisted(
                 "Skip blacklisted mods",
             ],
         )
-        # Remove blacklisted mods from list if user wants to download them still
-        if "Download" in answer:
-            publishedfileids.remove(publishedfileid)
+        # Remove blacklisted mods from list if user wants to skip them
+        if "Skip" in answer:
+            publishedfileids = [
+                publishedfileid
+                for publishedfileid in publishedfileids
+                if publishedfileid not in blacklisted_mods
+            ]
             logger.debug(
-                f"Skipping download of blacklisted Workshop mod: {publishedfileid}"
+                f"Skipping download of blacklisted Workshop mods: {list(blacklisted_mods)}"
             )
 
     return publishedfileids
@@ -2437,13 +2240,13 @@ def import_steamcmd_acf_data(
     rimsort_storage_path: str, steamcmd_appworkshop_acf_path: str
 ) -> None:
     logger.info(f"SteamCMD acf data path to update: {steamcmd_appworkshop_acf_path}")
-    if os.path.exists(steamcmd_appworkshop_acf_path):
-        logger.debug("Reading info...")
+    logger.debug("Reading info...")
+    try:
         steamcmd_appworkshop_acf = acf_to_dict(steamcmd_appworkshop_acf_path)
-        logger.debug("Retrieved SteamCMD data to update...")
-    else:
+    except FileNotFoundError:
         logger.warning("Specified SteamCMD acf file not found! Nothing was done...")
         return
+    logger.debug("Retrieved SteamCMD data to update...")
     logger.info("Opening file dialog to specify acf file to import")
     acf_to_import_path = show_dialogue_file(
         mode="open",
@@ -2452,38 +2255,25 @@ def import_steamcmd_acf_data(
         _filter="ACF (*.acf)",
     )
     logger.info(f"SteamCMD acf data path to import: {acf_to_import_path}")
-    if acf_to_import_path and os.path.exists(acf_to_import_path):
-        logger.debug("Reading info...")
+    if not acf_to_import_path:
+        logger.warning("Specified SteamCMD acf file not found! Nothing was done...")
+        return
+    logger.debug("Reading info...")
+    try:
         acf_to_import = acf_to_dict(acf_to_import_path)
-        logger.debug("Retrieved SteamCMD data to import...")
-    else:
+    except FileNotFoundError:
         logger.warning("Specified SteamCMD acf file not found! Nothing was done...")
         return
+    logger.debug("Retrieved SteamCMD data to import...")
     # Output
-    items_installed_before = len(
-        steamcmd_appworkshop_acf["AppWorkshop"]["WorkshopItemsInstalled"].keys()
-    )
-    logger.debug(f"WorkshopItemsInstalled beforehand: {items_installed_before}")
-    item_details_before = len(
-        steamcmd_appworkshop_acf["AppWorkshop"]["WorkshopItemDetails"].keys()
-    )
-    logger.debug(f"WorkshopItemDetails beforehand: {item_details_before}")
-    recursively_update_dict(
-        steamcmd_appworkshop_acf["AppWorkshop"]["WorkshopItemsInstalled"],
-        acf_to_import["AppWorkshop"]["WorkshopItemsInstalled"],
-    )
-    recursively_update_dict(
-        steamcmd_appworkshop_acf["AppWorkshop"]["WorkshopItemDetails"],
-        acf_to_import["AppWorkshop"]["WorkshopItemDetails"],
-    )
-    items_installed_after = len(
-        steamcmd_appworkshop_acf["AppWorkshop"]["WorkshopItemsInstalled"].keys()
-    )
-    logger.debug(f"WorkshopItemsInstalled after: {items_installed_after}")
-    item_details_after = len(
-        steamcmd_appworkshop_acf["AppWorkshop"]["WorkshopItemDetails"].keys()
-    )
-    logger.debug(f"WorkshopItemDetails after: {item_details_after}")
+    appworkshop = steamcmd_appworkshop_acf["AppWorkshop"]
+    appworkshop_to_import = acf_to_import["AppWorkshop"]
+    # Only the two Workshop item sections are merged, the remaining AppWorkshop
+    # values describe the SteamCMD prefix being updated and are kept as they are
+    for section in ("WorkshopItemsInstalled", "WorkshopItemDetails"):
+        logger.debug(f"{section} beforehand: {len(appworkshop[section])}")
+        recursively_update_dict(appworkshop[section], appworkshop_to_import[section])
+        logger.debug(f"{section} after: {len(appworkshop[section])}")
     logger.info("Successfully imported data!")
     logger.info(f"Writing updated data back to path: {steamcmd_appworkshop_acf_path}")
     dict_to_acf(data=steamcmd_appworkshop_acf, path=steamcmd_appworkshop_acf_path)
@@ -2501,27 +2291,27 @@ def query_workshop_update_data(mods: dict[str, Any]) -> str | None:
     """
     logger.info("Querying Steam WebAPI for SteamCMD/Steam mod update metadata")
 
-    workshop_mods_pfid_to_uuid = {
-        metadata["publishedfileid"]: uuid
-        for uuid, metadata in mods.items()
-        if (metadata.get("steamcmd") or metadata.get("data_source") == "workshop")
-        and metadata.get("publishedfileid")
-    }
+    workshop_mods_pfid_to_uuid: dict[str, str] = {}
+    for uuid, metadata in mods.items():
+        # Check the publishedfileid first, mods without one are skipped after one lookup
+        publishedfileid = metadata.get("publishedfileid")
+        if publishedfileid and (
+            metadata.get("data_source") == "workshop" or metadata.get("steamcmd")
+        ):
+            workshop_mods_pfid_to_uuid[publishedfileid] = uuid
 
     workshop_mods_query_updates = ISteamRemoteStorage_GetPublishedFileDetails(
         list(workshop_mods_pfid_to_uuid.keys())
     )
     if workshop_mods_query_updates and len(workshop_mods_query_updates) > 0:
         for workshop_mod_metadata in workshop_mods_query_updates:
-            uuid = workshop_mods_pfid_to_uuid[workshop_mod_metadata["publishedfileid"]]
-            if workshop_mod_metadata.get("time_created"):
-                mods[uuid]["external_time_created"] = workshop_mod_metadata[
-                    "time_created"
-                ]
-            if workshop_mod_metadata.get("time_updated"):
-                mods[uuid]["external_time_updated"] = workshop_mod_metadata[
-                    "time_updated"
-                ]
+            mod_metadata = mods[
+                workshop_mods_pfid_to_uuid[workshop_mod_metadata["publishedfileid"]]
+            ]
+            if time_created := workshop_mod_metadata.get("time_created"):
+                mod_metadata["external_time_created"] = time_created
+            if time_updated := workshop_mod_metadata.get("time_updated"):
+                mod_metadata["external_time_updated"] = time_updated
     else:
         return "failed"
 
@@ -2535,42 +2325,47 @@ def recursively_update_dict(
     purge_keys: Iterable[str] = [],
     recurse_exceptions: Iterable[str] = [],
 ) -> None:
-    # Check for keys in recurse_exceptions in a_dict that are not in b_dict and remove them
-    for key in set(a_dict.keys()) - set(b_dict.keys()):
-        if recurse_exceptions and key in recurse_exceptions:
-            del a_dict[key]
-    # Recursively update A with B, excluding recurse exceptions (list of keys to just overwrite)
-    for key, value in b_dict.items():
-        if recurse_exceptions and key in recurse_exceptions:
-            # If the key is an exception, update its value directly from B
-            a_dict[key] = value
-        elif (
-            key in a_dict and isinstance(a_dict[key], dict) and isinstance(value, dict)
-        ):
-            # If the key exists in both dictionaries and the values are dictionaries,
-            # recursively update the nested dictionaries except for the recurse exceptions list
-            recursively_update_dict(
-                a_dict[key],
-                value,
-                prune_exceptions=prune_exceptions,
-                purge_keys=purge_keys,
-                recurse_exceptions=recurse_exceptions,
-            )
-        else:
-            # Otherwise, update the value in A with the value from B
-            a_dict[key] = value
-    # Prune keys with empty dictionary values (except for keys in prune exceptions list)
-    keys_to_delete = [
-        key
-        for key, value in a_dict.items()
-        if isinstance(value, dict)
-        and not value
-        and (prune_exceptions is None or key not in prune_exceptions)
-    ]
-    for key in keys_to_delete:
-        del a_dict[key]
-    # Delete keys from the list of keys to delete
-    if purge_keys is not None:
-        for key in purge_keys:
-            if key in a_dict:
-                del a_dict[key]
+    prune_exceptions = frozenset(prune_exceptions or ())
+    purge_keys = frozenset(purge_keys or ())
+    recurse_exceptions = frozenset(recurse_exceptions or ())
+    # Walk the nested dictionaries with a stack instead of recursing. Each pair is
+    # visited twice: once to update A with B, and once more after its nested
+    # dictionaries are done, to prune it
+    stack: list[tuple[dict[str, Any], dict[str, Any], bool]] = [(a_dict, b_dict, False)]
+    while stack:
+        a, b, updated = stack.pop()
+        if updated:
+            # Prune keys with empty dictionary values (except for keys in prune exceptions list)
+            keys_to_delete = [
+                key
+                for key, value in a.items()
+                if isinstance(value, dict) and not value and key not in prune_exceptions
+            ]
+            for key in keys_to_delete:
+                del a[key]
+            # Delete keys from the list of keys to delete
+            for key in purge_keys:
+                if key in a:
+                    del a[key]
+            continue
+        stack.append((a, b, True))
+        # Check for keys in recurse_exceptions in A that are not in B and remove them
+        if recurse_exceptions:
+            for key in a.keys() - b.keys():
+                if key in recurse_exceptions:
+                    del a[key]
+        # Update A with B, excluding recurse exceptions (list of keys to just overwrite)
+        nested = []
+        for key, value in b.items():
+            if key in recurse_exceptions:
+                # If the key is an exception, update its value directly from B
+                a[key] = value
+            elif key in a and isinstance(a[key], dict) and isinstance(value, dict):
+                # If the key exists in both dictionaries and the values are dictionaries,
+                # update the nested dictionaries as well
+                nested.append((a[key], value, False))
+            else:
+                # Otherwise, update the value in A with the value from B
+                a[key] = value
+        # Reversed, so the nested dictionaries are updated in B's order
+        stack.extend(reversed(nested))
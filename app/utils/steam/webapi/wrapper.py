@@ -1,11 +1,15 @@
 import sys
 import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from logging import WARNING, getLogger
 from math import ceil
 from multiprocessing import Pool, cpu_count
 from time import time
 from typing import TYPE_CHECKING, Any, Dict
 
+import msgspec
 from loguru import logger
 from PySide6.QtCore import QObject, Signal
 from requests import post as requests_post
@@ -32,6 +36,10 @@ getLogger("urllib3").setLevel(WARNING)
 BASE_URL = "https://steamcommunity.com"
 BASE_URL_STEAMFILES = "https://steamcommunity.com/sharedfiles/filedetails/?id="
 BASE_URL_WORKSHOP = "https://steamcommunity.com/workshop/filedetails/?id="
+# Number of IPublishedFileService/GetDetails chunks requested at the same time
+GET_DETAILS_MAX_WORKERS = 4
+# Number of chunks requested ahead of the one being parsed
+GET_DETAILS_MAX_IN_FLIGHT = 2 * GET_DETAILS_MAX_WORKERS
 
 
 class CollectionImport:
@@ -175,8 +183,12 @@ class DynamicQuery(QObject):
         self.pagenum = 1
         self.pages = 1
         self.publishedfileids: list[str] = []
+        # Membership index for publishedfileids, since QueryFiles pages can overlap
+        self._publishedfileids_set: set[str] = set()
         self.total = 0
         self.database: dict[str, Any] = {}
+        # PublishedFileId -> PublishedFileIds of its children, for every queried mod
+        self._children: dict[str, list[str]] = {}
 
     def __expires(self, life: int) -> int:
         """Returns current epoch + life
@@ -235,54 +247,44 @@ class DynamicQuery(QObject):
         query = database
         query["version"] = self.expiry
         query["database"] = database["database"]
-        querying = True
-        while querying:  # Begin initial query
-            result = self.IPublishedFileService_GetDetails(query, publishedfileids)
+        self._children = {}
+        queried: set[str] = set()
+        to_query = publishedfileids
+        while to_query:  # Begin initial query
+            queried.update(to_query)
+            result = self.IPublishedFileService_GetDetails(query, to_query)
 
             if result is None:
                 logger.warning(
-                    f"Dynamic Query failed to initialize WebAPI query! Critical failure. Aborting steam_db creation. query: {query} publishedfileids: {publishedfileids}"
+                    f"Dynamic Query failed to initialize WebAPI query! Critical failure. Aborting steam_db creation. query: {query} publishedfileids: {to_query}"
                 )
                 return
 
             # Returns WHAT we can get remotely, FROM what we have locally
             query, missing_children = result
 
-            if (
-                missing_children and len(missing_children) > 0
-            ):  # If we have missing data for any dependency...
+            # Launch a separate query for any missing_children, to append their
+            # metadata to the query["database"]. This will ensure that we get ALL
+            # dependency data that is possible, even if we do not have the
+            # dependenc{y, ies}. Each PublishedFileId is only queried once.
+            to_query = [
+                missing_child
+                for missing_child in missing_children
+                if missing_child not in queried
+            ]
+            if to_query:  # If we have missing data for any dependency...
                 # Uncomment to see the contents of missing_children
-                # logger.debug(missing_children)
+                # logger.debug(to_query)
                 self.dq_messaging_signal.emit(
-                    f"\nRetrieving dependency information for {len(missing_children)} missing children"
+                    f"\nRetrieving dependency information for {len(to_query)} missing children"
                 )
-                # Extend publishedfileids with the missing_children PublishedFileIds for final query
-                publishedfileids.extend(missing_children)
-                # Launch a separate query from the initial, to recursively append
-                # any of the missing_children's metadata to the query["database"].
-                #
-                # This will ensure that we get ALL dependency data that is possible,
-                # even if we do not have the dependenc{y, ies}. It's not perfect,
-                # because it will always cause one additional full query to ensure that
-                # the query["database"] is complete with missing_children metadata.
-                #
-                # It is the only way to paint the full picture without already
-                # possessing the mod's metadata for the initial query.
-                result = self.IPublishedFileService_GetDetails(query, missing_children)
-
-                if result is None:
-                    logger.warning(
-                        f"Dynamic Query failed to initialize WebAPI query! Critical failure. Aborting steam_db creation. Query: {query} Missing Children: {missing_children}"
-                    )
-                    return
+                # Extend publishedfileids with the missing_children PublishedFileIds
+                publishedfileids.extend(to_query)
 
-                query, missing_children = result
-                self.dq_messaging_signal.emit(
-                    "\nLaunching addiitonal full query to complete dependency information for the missing children"
-                )
-            else:  # Stop querying once we have 0 missing_children
-                missing_children = []
-                querying = False
+        # A mod's dependencies were filled in from whatever was in the database when
+        # it was parsed. Now that every dependency has been queried, rebuild them
+        # all from the complete database instead of running another full query
+        self.__rebuild_dependencies(query["database"])
 
         if self.get_appid_deps:
             self.dq_messaging_signal.emit(
@@ -304,6 +306,34 @@ class DynamicQuery(QObject):
         )
         self.database.update(query)
 
+    def __rebuild_dependencies(self, database: dict[str, Any]) -> None:
+        """
+        Rebuild the dependencies of every queried mod from the current database.
+
+        :param database: the query["database"] being built
+        """
+        for publishedfileid, children in self._children.items():
+            dependencies = database[publishedfileid]["dependencies"]
+            dependencies.clear()
+            for child_pfid in children:
+                child = database.get(child_pfid)
+                if child and not child.get("unpublished"):
+                    dependencies[child_pfid] = self.__dependency_info(child_pfid, child)
+
+    @staticmethod
+    def __dependency_info(child_pfid: str, child: dict[str, Any]) -> list[str]:
+        """
+        Returns the [name, url] pair stored for a dependency of a mod.
+
+        :param child_pfid: the PublishedFileId of the dependency
+        :param child: the dependency's database entry
+        """
+        # Use local name over Steam name if possible. "UNKNOWN" is a stub value
+        # used in-memory only (hopefully) and is intended for AppIdQuery first pass
+        child_name = child.get("name") or child.get("steamName") or "UNKNOWN"
+        child_url = child.get("url", f"{BASE_URL_STEAMFILES}{child_pfid}")
+        return [child_name, child_url]
+
     def pfids_by_appid(self) -> None:
         """
         Builds a total collection of PublishedFileIds representing a list of all workshop mods
@@ -352,20 +382,20 @@ class DynamicQuery(QObject):
         )
         if not self.api:  # If we don't have API initialized
             return None  # Exit query
-        missing_children = []
+        # Kept as a list to preserve query order, with a set for membership checks
+        missing_children: list[str] = []
+        missing_children_set: set[str] = set()
         result = json_to_update
-        # Uncomment to see the all pfids to be queried
-        # logger.debug(f"PublishedFileIds being queried: {publishedfileids}")
-        for chunk in chunks(
-            _list=publishedfileids, limit=213
-        ):  # Chunk limit appears to be 213 PublishedFileIds at a time - this appears to be a WebAPI limitation
-            chunk_total = len(chunk)
-            chunks_processed += chunk_total
-            # Uncomment to see the pfids from each chunk
-            # logger.debug(f"{chunk_total} PublishedFileIds in chunk: {chunk}")
-            try:
-                response = self.api.call(
-                    method_path="IPublishedFileService.GetDetails",
+        database = result["database"]
+        # Resolve the WebAPI method once for every chunk of this query. It is not
+        # cached on the instance, since __initialize_webapi may recreate self.api
+        api_get_details = self.api.IPublishedFileService.GetDetails
+
+        def get_details(chunk: list[str]) -> Any:
+            # Take the raw response body and decode it with msgspec, which is
+            # considerably faster than the stdlib json used by requests
+            return msgspec.json.decode(
+                api_get_details(
                     key=self.apikey,
                     publishedfileids=chunk,
                     includetags=False,
@@ -381,121 +411,123 @@ class DynamicQuery(QObject):
                     strip_description_bbcode=False,
                     includereactions=False,
                     admin_query=False,
+                    raw=True,
                 )
-                for metadata in response["response"]["publishedfiledetails"]:
-                    publishedfileid = metadata[
-                        "publishedfileid"
-                    ]  # Set the PublishedFileId to that of the metadata we are parsing
-
-                    # Uncomment this to view the metadata being parsed in real time
-                    # logger.debug(f"{publishedfileid}: {metadata}")
-                    # If the mod is no longer published
-                    if metadata["result"] != 1:
-                        if not result[
-                            "database"
-                        ].get(
-                            publishedfileid
-                        ):  # If we don't already have a ["database"] entry for this pfid
-                            result["database"][publishedfileid] = {}
-                        logger.debug(
-                            f"Tried to parse metadata for a mod that is deleted/private/removed/unposted: {publishedfileid}"
-                        )
-                        result["database"][publishedfileid]["unpublished"] = True
-                        # If mod is unpublished, it has no metadata.
-                        continue  # We are done with this publishedfileid
-                    else:
-                        # This case is mostly intended for any missing_children passed back thru
-                        # If this is part of an AppIDQuery, then it is useful for population of
-                        # child_name and/or child_url below as part of the dependency data being collected
-                        if not result[
-                            "database"
-                        ].get(
-                            publishedfileid
-                        ):  # If we don't already have a ["database"] entry for this pfid
-                            result["database"][
-                                publishedfileid
-                            ] = {}  # Add in skeleton data
-                        # We populate the data
-                        result["database"][publishedfileid]["steamName"] = metadata[
-                            "title"
+            )
+
+        # Uncomment to see the all pfids to be queried
+        # logger.debug(f"PublishedFileIds being queried: {publishedfileids}")
+        # The chunks are requested a few at a time, since each one mostly waits on the
+        # WebAPI. Their responses are still parsed here, one chunk at a time, in order
+        chunk_iter = chunks(
+            _list=publishedfileids, limit=213
+        )  # Chunk limit appears to be 213 PublishedFileIds at a time - this appears to be a WebAPI limitation
+        with ThreadPoolExecutor(max_workers=GET_DETAILS_MAX_WORKERS) as executor:
+            # Only a bounded number of chunks are queued at once, and the next one is
+            # submitted as each is consumed, so responses don't pile up ahead of parsing
+            pending: deque[tuple[list[str], Future[Any]]] = deque(
+                (chunk, executor.submit(get_details, chunk))
+                for chunk in islice(chunk_iter, GET_DETAILS_MAX_IN_FLIGHT)
+            )
+            while pending:
+                chunk, future = pending.popleft()
+                next_chunk = next(chunk_iter, None)
+                if next_chunk is not None:
+                    pending.append(
+                        (next_chunk, executor.submit(get_details, next_chunk))
+                    )
+                chunk_total = len(chunk)
+                chunks_processed += chunk_total
+                # Uncomment to see the pfids from each chunk
+                # logger.debug(f"{chunk_total} PublishedFileIds in chunk: {chunk}")
+                try:
+                    response = future.result()
+                    for metadata in response["response"]["publishedfiledetails"]:
+                        publishedfileid = metadata[
+                            "publishedfileid"
+                        ]  # Set the PublishedFileId to that of the metadata we are parsing
+
+                        # Uncomment this to view the metadata being parsed in real time
+                        # logger.debug(f"{publishedfileid}: {metadata}")
+                        # If we don't already have a ["database"] entry for this pfid, add in skeleton data
+                        entry = database.setdefault(publishedfileid, {})
+                        # If the mod is no longer published
+                        if metadata["result"] != 1:
+                            logger.debug(
+                                f"Tried to parse metadata for a mod that is deleted/private/removed/unposted: {publishedfileid}"
+                            )
+                            entry["unpublished"] = True
+                            # If mod is unpublished, it has no metadata.
+                            continue  # We are done with this publishedfileid
+                        else:
+                            # This case is mostly intended for any missing_children passed back thru
+                            # If this is part of an AppIDQuery, then it is useful for population of
+                            # child_name and/or child_url below as part of the dependency data being collected
+                            # We populate the data
+                            entry["steamName"] = metadata["title"]
+                            entry["url"] = f"{BASE_URL_STEAMFILES}{publishedfileid}"
+                            # Track time publishing created
+                            # entry["external_time_created"] = metadata["time_created"]
+                            # # Track time publishing last updated
+                            # entry["external_time_updated"] = metadata["time_updated"]
+                            dependencies: dict[str, list[str]] = {}
+                            entry["dependencies"] = dependencies
+                            # If the publishing has listed mod dependencies
+                            if metadata.get("children"):
+                                self._children[publishedfileid] = [
+                                    children["publishedfileid"]
+                                    for children in metadata["children"]
+                                ]
+                                for children in metadata[
+                                    "children"
+                                ]:  # Check if children present in database
+                                    child_pfid = children["publishedfileid"]
+                                    # If we have data for this child already cached
+                                    child = database.get(child_pfid)
+                                    if child:
+                                        if not child.get(
+                                            "unpublished"
+                                        ):  # ... and the mod is published, populate it
+                                            dependencies[child_pfid] = (
+                                                self.__dependency_info(
+                                                    child_pfid, child
+                                                )
+                                            )
+                                    else:  # Child was not found in database, track it's pfid for later
+                                        if child_pfid not in missing_children_set:
+                                            logger.debug(
+                                                f"Could not find pfid {child_pfid} in database. Adding child to missing_children"
+                                            )
+                                            missing_children_set.add(child_pfid)
+                                            missing_children.append(child_pfid)
+                except Exception as e:
+                    stacktrace = traceback.format_exc()
+                    if (
+                        e.__class__.__name__ == "HTTPError"
+                        or e.__class__.__name__ == "SSLError"
+                    ):  # requests.exceptions.HTTPError OR urllib3.exceptions.SSLError
+                        # If an HTTPError from steam/urllib3 module(s) somehow is uncaught,
+                        # try to remove the Steam API key from the stacktrace
+                        pattern = "&key="
+                        stacktrace = stacktrace[
+                            : len(stacktrace)
+                            - (
+                                len(stacktrace)
+                                - (stacktrace.find(pattern) + len(pattern))
+                            )
                         ]
-                        result["database"][publishedfileid]["url"] = (
-                            f"https://steamcommunity.com/sharedfiles/filedetails/?id={publishedfileid}"
-                        )
-                        # Track time publishing created
-                        # result["database"][publishedfileid][
-                        #     "external_time_created"
-                        # ] = metadata["time_created"]
-                        # # Track time publishing last updated
-                        # result["database"][publishedfileid][
-                        #     "external_time_updated"
-                        # ] = metadata["time_updated"]
-                        result["database"][publishedfileid]["dependencies"] = {}
-                        # If the publishing has listed mod dependencies
-                        if metadata.get("children"):
-                            for children in metadata[
-                                "children"
-                            ]:  # Check if children present in database
-                                child_pfid = children["publishedfileid"]
-                                if result["database"].get(
-                                    child_pfid
-                                ):  # If we have data for this child already cached
-                                    if not result["database"][child_pfid].get(
-                                        "unpublished"
-                                    ):  # ... and the mod is published, populate it
-                                        if result["database"][child_pfid].get(
-                                            "name"
-                                        ):  # Use local name over Steam name if possible
-                                            child_name = result["database"][child_pfid][
-                                                "name"
-                                            ]
-                                        elif result["database"][child_pfid].get(
-                                            "steamName"
-                                        ):
-                                            child_name = result["database"][child_pfid][
-                                                "steamName"
-                                            ]
-                                        else:  # This is a stub value used in-memory only (hopefully)
-                                            # and is intended for AppIdQuery first pass
-                                            child_name = "UNKNOWN"
-                                        child_url = result["database"][child_pfid][
-                                            "url"
-                                        ]
-                                        result["database"][publishedfileid][
-                                            "dependencies"
-                                        ][child_pfid] = [child_name, child_url]
-                                else:  # Child was not found in database, track it's pfid for later
-                                    if child_pfid not in missing_children:
-                                        logger.debug(
-                                            f"Could not find pfid {child_pfid} in database. Adding child to missing_children"
-                                        )
-                                        missing_children.append(child_pfid)
-            except Exception as e:
-                stacktrace = traceback.format_exc()
-                if (
-                    e.__class__.__name__ == "HTTPError"
-                    or e.__class__.__name__ == "SSLError"
-                ):  # requests.exceptions.HTTPError OR urllib3.exceptions.SSLError
-                    # If an HTTPError from steam/urllib3 module(s) somehow is uncaught,
-                    # try to remove the Steam API key from the stacktrace
-                    pattern = "&key="
-                    stacktrace = stacktrace[
-                        : len(stacktrace)
-                        - (len(stacktrace) - (stacktrace.find(pattern) + len(pattern)))
-                    ]
-                logger.error(
-                    f"IPublishedFileService/GetDetails errored querying batch [{chunks_processed}/{total}]: {stacktrace}"
+                    logger.error(
+                        f"IPublishedFileService/GetDetails errored querying batch [{chunks_processed}/{total}]: {stacktrace}"
+                    )
+                self.dq_messaging_signal.emit(
+                    f"IPublishedFileService/GetDetails chunk [{chunks_processed}/{total}]"
                 )
-            self.dq_messaging_signal.emit(
-                f"IPublishedFileService/GetDetails chunk [{chunks_processed}/{total}]"
-            )
-        for missing_child in missing_children:
-            if result["database"].get(missing_child) and result["database"][
-                missing_child
-            ].get(
-                "unpublished"
-            ):  # If there is somehow an unpublished mod in missing_children, remove it
-                missing_children.remove(missing_child)
+        # If there is somehow an unpublished mod in missing_children, remove it
+        missing_children = [
+            missing_child
+            for missing_child in missing_children
+            if not database.get(missing_child, {}).get("unpublished")
+        ]
         return result, missing_children
 
     def IPublishedFileService_QueryFiles(self, cursor: str) -> str:
@@ -579,10 +611,16 @@ class DynamicQuery(QObject):
             f"IPublishedFileService/QueryFiles page [{str(self.pagenum)}"
             + f"/{str(self.pages)}]"
         )
-        ids_from_page = []
-        for item in result["response"]["publishedfiledetails"]:
-            self.publishedfileids.append(item["publishedfileid"])
-            ids_from_page.append(item["publishedfileid"])
+        new_publishedfileids = [
+            publishedfileid
+            for publishedfileid in dict.fromkeys(
+                item["publishedfileid"]
+                for item in result["response"]["publishedfiledetails"]
+            )
+            if publishedfileid not in self._publishedfileids_set
+        ]
+        self._publishedfileids_set.update(new_publishedfileids)
+        self.publishedfileids.extend(new_publishedfileids)
         self.pagenum += 1
         return result["response"]["next_cursor"]
 
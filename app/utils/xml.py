@@ -1,5 +1,5 @@
-import os
 from typing import Any
+from xml.etree.ElementTree import iterparse
 
 import xmltodict
 from bs4 import BeautifulSoup
@@ -15,28 +15,33 @@ def xml_path_to_json(path: str) -> dict[str, Any]:
     :return: JSON dict of XML file contents.
     """
     data: dict[str, Any] = {}
-    if not os.path.exists(path):
+    # Read the file once, both parsers below work on the same bytes
+    try:
+        with open(path, "rb") as file:
+            xml_bytes = file.read()
+    except FileNotFoundError:
         logger.error(f"XML file does not exist at: {path}")
         return data
+    except OSError as e:
+        logger.error(f"Error reading XML file {path}: {e}")
+        return data
     try:
         try:
             # Try parsing the XML file using xmltodict
-            with open(path, "rb") as file:
-                data = xmltodict.parse(file.read(), dict_constructor=dict)
+            data = xmltodict.parse(xml_bytes, dict_constructor=dict)
         except Exception as e:
             # If xmltodict parsing fails, attempt parsing with BeautifulSoup
             logger.debug(f"Error parsing XML file with xmltodict: {e}")
             logger.debug("Trying to parse with BeautifulSoup as a fallback")
-            with open(path, "rb") as f:
-                soup = BeautifulSoup(f.read(), "lxml-xml")
-                # Find and remove empty tags
-                empty_tags = soup.find_all(
-                    lambda tag: not tag.text.strip() or len(tag) == 0
-                )
-                for empty_tag in empty_tags:
-                    empty_tag.extract()
-                # Convert the BeautifulSoup object to a dictionary using xmltodict
-                data = xmltodict.parse(str(soup), dict_constructor=dict)
+            soup = BeautifulSoup(xml_bytes, "lxml-xml")
+            # Find and remove empty tags
+            empty_tags = soup.find_all(
+                lambda tag: not tag.text.strip() or len(tag) == 0
+            )
+            for empty_tag in empty_tags:
+                empty_tag.extract()
+            # Convert the BeautifulSoup object to a dictionary using xmltodict
+            data = xmltodict.parse(str(soup), dict_constructor=dict)
         # Return the parsed data
         return data
     except Exception as e:
@@ -45,6 +50,50 @@ def xml_path_to_json(path: str) -> dict[str, Any]:
         return data
 
 
+# Where each supported RimWorld mods list format keeps its list of mod ids:
+# Config/ModsConfig.xml, .rws savegames and .rml modlists
+MODS_LIST_PATHS = (
+    ("ModsConfigData", "activeMods"),
+    ("savegame", "meta", "modIds"),
+    ("savedModList", "meta", "modIds"),
+)
+
+
+def mods_list_path_to_json(path: str) -> dict[str, Any]:
+    """
+    Return the mod ids of a RimWorld mods list, shaped like the JSON returned by
+    `xml_path_to_json`, without parsing the rest of the file.
+
+    The file is parsed incrementally and parsing stops as soon as the mod ids
+    are read. This matters for .rws savegames, which keep the mod ids in
+    their header but can be very large. If the file cannot be parsed this way,
+    fall back to `xml_path_to_json`.
+
+    :param path: Path to the mods list file.
+    :return: JSON dict containing only the mod ids of the mods list.
+    """
+    tags: list[str] = []
+    mod_ids: list[str | None] = []
+    try:
+        for event, element in iterparse(path, events=("start", "end")):
+            if event == "start":
+                tags.append(element.tag)
+                continue
+            tags.pop()
+            parent = tuple(tags)
+            if element.tag == "li" and parent in MODS_LIST_PATHS:
+                # Match xmltodict, which strips whitespace and maps empty text to None
+                mod_ids.append((element.text or "").strip() or None)
+            elif parent + (element.tag,) in MODS_LIST_PATHS:
+                data: dict[str, Any] = {"li": mod_ids}
+                for tag in reversed(parent + (element.tag,)):
+                    data = {tag: data}
+                return data
+    except Exception as e:
+        logger.debug(f"Error parsing mods list incrementally: {e}")
+    return xml_path_to_json(path)
+
+
 def json_to_xml_write(data: dict[str, Any], path: str) -> None:
     """
     Write JSON data to an XML file.
@@ -62,6 +62,7 @@ from app.utils.event_bus import EventBus
 from app.utils.generic import (
     chunks,
     copy_to_clipboard_safely,
+    decode_json_file,
     delete_files_except_extension,
     launch_game_process,
     open_url_browser,
@@ -1085,7 +1086,7 @@ class MainContent(QObject):
             )
             # Wait for settings dialog to be closed before continuing.
             # This is to ensure steamcmd check and other ops are done after the user has a chance to set paths
-            if not self.settings_controller.settings_dialog.isHidden():
+            if self.settings_controller.is_settings_dialog_visible():
                 loop = QEventLoop()
                 self.settings_controller.settings_dialog.finished.connect(loop.quit)
                 loop.exec_()
@@ -2524,11 +2525,9 @@ class MainContent(QObject):
                     file_full_path = str((Path(repo_path) / file_name))
                     if os.path.exists(file_full_path):
                         # Load JSON data
-                        with open(file_full_path, encoding="utf-8") as f:
-                            json_string = f.read()
-                            logger.debug("Reading info...")
-                            database = json.loads(json_string)
-                            logger.debug("Retrieved database...")
+                        logger.debug("Reading info...")
+                        database = decode_json_file(file_full_path)
+                        logger.debug("Retrieved database...")
                         if database.get("version"):
                             database_version = (
                                 database["version"]
@@ -3001,11 +3000,9 @@ class MainContent(QObject):
         )
         logger.info(f"Selected path: {input_path_a}")
         if input_path_a and os.path.exists(input_path_a):
-            with open(input_path_a, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.debug("Reading info...")
-                db_input_a = json.loads(json_string)
-                logger.debug("Retrieved database A...")
+            logger.debug("Reading info...")
+            db_input_a = decode_json_file(input_path_a)
+            logger.debug("Retrieved database A...")
         else:
             logger.warning("Steam DB Builder: User cancelled selection...")
             return
@@ -3019,11 +3016,9 @@ class MainContent(QObject):
         )
         logger.info(f"Selected path: {input_path_b}")
         if input_path_b and os.path.exists(input_path_b):
-            with open(input_path_b, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.debug("Reading info...")
-                db_input_b = json.loads(json_string)
-                logger.debug("Retrieved database B...")
+            logger.debug("Reading info...")
+            db_input_b = decode_json_file(input_path_b)
+            logger.debug("Retrieved database B...")
         else:
             logger.debug("Steam DB Builder: User cancelled selection...")
             return
@@ -3114,11 +3109,9 @@ class MainContent(QObject):
         )
         logger.info(f"Selected path: {input_path_a}")
         if input_path_a and os.path.exists(input_path_a):
-            with open(input_path_a, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.debug("Reading info...")
-                db_input_a = json.loads(json_string)
-                logger.debug("Retrieved database A...")
+            logger.debug("Reading info...")
+            db_input_a = decode_json_file(input_path_a)
+            logger.debug("Retrieved database A...")
         else:
             logger.warning("Steam DB Builder: User cancelled selection...")
             return
@@ -3132,11 +3125,9 @@ class MainContent(QObject):
         )
         logger.info(f"Selected path: {input_path_b}")
         if input_path_b and os.path.exists(input_path_b):
-            with open(input_path_b, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.debug("Reading info...")
-                db_input_b = json.loads(json_string)
-                logger.debug("Retrieved database B...")
+            logger.debug("Reading info...")
+            db_input_b = decode_json_file(input_path_b)
+            logger.debug("Retrieved database B...")
         else:
             logger.debug("Steam DB Builder: User cancelled selection...")
             return
@@ -3187,13 +3178,11 @@ class MainContent(QObject):
             return
         # Retrieve original database
         try:
-            with open(path, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.debug("Reading info...")
-                db_input_a = json.loads(json_string)
-                logger.debug(
-                    f"Retrieved copy of existing {rules_source} database to update."
-                )
+            logger.debug("Reading info...")
+            db_input_a = decode_json_file(path)
+            logger.debug(
+                f"Retrieved copy of existing {rules_source} database to update."
+            )
         except Exception:
             logger.error("Failed to read info from existing database")
             dialogue.show_warning(
@@ -2631,16 +2631,19 @@ class ModsPanel(QWidget):
         )
 
     def on_mod_deleted(self, uuid: str) -> None:
-        if uuid in self.active_mods_list.uuids:
-            index = self.active_mods_list.uuids.index(uuid)
-            self.active_mods_list.takeItem(index)
-            self.active_mods_list.uuids.pop(index)
-            self.update_count(list_type="Active")
-        elif uuid in self.inactive_mods_list.uuids:
-            index = self.inactive_mods_list.uuids.index(uuid)
-            self.inactive_mods_list.takeItem(index)
-            self.inactive_mods_list.uuids.pop(index)
-            self.update_count(list_type="Inactive")
+        # Look the uuid up once per list instead of a membership test plus index()
+        for mods_list, list_type in (
+            (self.active_mods_list, "Active"),
+            (self.inactive_mods_list, "Inactive"),
+        ):
+            try:
+                index = mods_list.uuids.index(uuid)
+            except ValueError:
+                continue
+            mods_list.takeItem(index)
+            mods_list.uuids.pop(index)
+            self.update_count(list_type=list_type)
+            return
 
     def on_mod_metadata_updated(self, uuid: str) -> None:
         if uuid in self.active_mods_list.uuids:
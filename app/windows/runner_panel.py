@@ -1,11 +1,12 @@
+import codecs
 import os
 from platform import system
-from re import compile, search
+from re import compile
 from typing import Any, Sequence
 
 import psutil
 from loguru import logger
-from PySide6.QtCore import QProcess, Qt, Signal
+from PySide6.QtCore import QProcess, Qt, QTimer, Signal
 from PySide6.QtGui import QCloseEvent, QFont, QIcon, QKeyEvent, QTextCursor
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -26,6 +27,17 @@ from app.views.dialogue import (
     show_dialogue_file,
 )
 
+# Oldest lines are dropped past this many, to bound the runner's memory and layout cost
+MAX_BLOCK_COUNT = 10_000
+
+# Output patterns, compiled once since they are matched against every chunk of output
+ANSI_ESCAPE_PATTERN = compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+STEAMCMD_DOWNLOADING_ITEM_PATTERN = compile(r"Downloading item (\d+)...")
+TODDS_PROGRESS_PATTERN = compile(r"Progress: (\d+)/(\d+)")
+QUERY_PROGRESS_PATTERN = compile(
+    r"IPublishedFileService/(QueryFiles|GetDetails) (page|chunk) \[(\d+)\/(\d+)\]"
+)
+
 
 class RunnerPanel(QWidget):
     """
@@ -45,7 +57,6 @@ class RunnerPanel(QWidget):
         super().__init__()
 
         logger.debug("Initializing RunnerPanel")
-        self.ansi_escape = compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
         self.system = system()
         self.installEventFilter(self)
 
@@ -56,8 +67,8 @@ class RunnerPanel(QWidget):
 
         # The "runner"
         self.text = QPlainTextEdit()
-        self.text.verticalScrollBar().setValue(self.text.verticalScrollBar().maximum())
         self.text.setReadOnly(True)
+        self.text.setMaximumBlockCount(MAX_BLOCK_COUNT)
         # Font cfg by platform
         if self.system == "Darwin":
             self.text.setFont(QFont("Monaco"))
@@ -65,13 +76,25 @@ class RunnerPanel(QWidget):
             self.text.setFont(QFont("DejaVu Sans Mono"))
         elif self.system == "Windows":
             self.text.setFont(QFont("Cascadia Code"))
+        # Appended lines are batched and written to the runner at most once per
+        # frame, instead of relaying out the text for every chunk of output
+        self._pending_text: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_text)
 
         # A runner can have a process executed and display it's output
-        self.process = QProcess()
+        self.process = self._create_process()
         self.process_killed = False
         self.process_last_output = ""
         self.process_last_command = ""
         self.process_last_args: Sequence[str] = []
+        # Output can end in the middle of a multibyte character, so it is decoded
+        # incrementally and any partial character is held until the rest arrives
+        self.process_output_decoder = codecs.getincrementaldecoder("utf-8")(
+            errors="replace"
+        )
         self.steamcmd_current_pfid: str | None = None
         self.todds_dry_run_support = todds_dry_run_support
 
@@ -144,6 +167,15 @@ class RunnerPanel(QWidget):
 
         self._do_clear_runner()
 
+    def _create_process(self) -> QProcess:
+        process = QProcess(self)
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        process.readyReadStandardError.connect(self.handle_output)
+        process.readyReadStandardOutput.connect(self.handle_output)
+        process.finished.connect(self.finished)
+        process.errorOccurred.connect(self.handle_error)
+        return process
+
     def closeEvent(self, event: QCloseEvent) -> None:
         self.closing_signal.emit()
         self._do_kill_process()
@@ -155,8 +187,14 @@ class RunnerPanel(QWidget):
             self.close()
 
     def _do_clear_runner(self) -> None:
+        self._pending_text.clear()
         self.text.clear()
 
+    def _flush_text(self) -> None:
+        if self._pending_text:
+            self.text.appendPlainText("\n".join(self._pending_text))
+            self._pending_text.clear()
+
     def _do_kill_process(self) -> None:
         if self.process and self.process.state() == QProcess.ProcessState.Running:
             # Terminate the main process and its child processes
@@ -191,6 +229,7 @@ class RunnerPanel(QWidget):
                 logger.info(
                     "Exporting current runner output to the designated txt file"
                 )
+                self._flush_text()
                 with open(file_path, "w", encoding="utf-8") as outfile:
                     logger.info("Writing to file")
                     outfile.write(self.text.toPlainText())
@@ -221,13 +260,12 @@ class RunnerPanel(QWidget):
         self.kill_process_button.show()
         self.process_last_command = command
         self.process_last_args = args
-        self.process = QProcess(self)
+        # Reuse the runner's QProcess unless it is still busy with a previous command
+        if self.process.state() != QProcess.ProcessState.NotRunning:
+            self.process = self._create_process()
+        self.process_output_decoder.reset()
         self.process.setProgram(command)
         self.process.setArguments(args)
-        self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
-        self.process.readyReadStandardError.connect(self.handle_output)
-        self.process.readyReadStandardOutput.connect(self.handle_output)
-        self.process.finished.connect(self.finished)
         if progress_bar:
             self.progress_bar.show()
             self.progress_bar.setValue(0)
@@ -239,26 +277,28 @@ class RunnerPanel(QWidget):
             self.message(f"\nExecuting command:\n{command} {' '.join(args)}\n\n")
         self.process.start()
 
-    def handle_output(self) -> None:
+    def handle_output(self, final: bool = False) -> None:
+        # readAll() drains everything buffered so far. A later readyRead for the same
+        # data finds nothing left, so skip it rather than appending an empty line
         data = self.process.readAll()
-        stdout = self.ansi_escape.sub("", bytes(data.data()).decode("utf8"))
-        self.message(stdout)
+        stdout = self.process_output_decoder.decode(data.data(), final)
+        if not stdout:
+            return
+        self.message(ANSI_ESCAPE_PATTERN.sub("", stdout))
 
     def message(self, line: str) -> None:
         overwrite = False
-        if self.process and self.process.state() == QProcess.ProcessState.Running:
-            logger.debug(f"[{self.process.program().split('/')[-1]}]\n{line}")
+        running = self.process.state() == QProcess.ProcessState.Running
+        program = self.process.program() if running else ""
+        if running:
+            logger.debug(f"[{program.split('/')[-1]}]\n{line}")
         else:
-            logger.debug(f"{line}")
+            logger.debug(line)
 
         # Hardcoded steamcmd progress output support
-        if (  # -------STEAM-------
-            self.process
-            and self.process.state() == QProcess.ProcessState.Running
-            and "steamcmd" in self.process.program()
-        ):
+        if running and "steamcmd" in program:  # -------STEAM-------
             if "Downloading item " in line:
-                match = search(r"Downloading item (\d+)...", line)
+                match = STEAMCMD_DOWNLOADING_ITEM_PATTERN.search(line)
                 if match:
                     self.steamcmd_current_pfid = match.group(1)
             # Overwrite when SteamCMD client is doing updates
@@ -292,12 +332,8 @@ class RunnerPanel(QWidget):
             # -------STEAM-------
 
         # Hardcoded todds progress output support
-        elif (  # -------TODDS-------
-            self.process
-            and self.process.state() == QProcess.ProcessState.Running
-            and "todds" in self.process.program()
-        ):
-            match = search(r"Progress: (\d+)/(\d+)", line)
+        elif running and "todds" in program:  # -------TODDS-------
+            match = TODDS_PROGRESS_PATTERN.search(line)
             if match:
                 self.progress_bar.setRange(0, int(match.group(2)))
                 self.progress_bar.setValue(int(match.group(1)))
@@ -306,10 +342,7 @@ class RunnerPanel(QWidget):
 
         # Hardcoded query progress output support
         # -------QUERY-------
-        match = search(
-            r"IPublishedFileService/(QueryFiles|GetDetails) (page|chunk) \[(\d+)\/(\d+)\]",
-            line,
-        )
+        match = QUERY_PROGRESS_PATTERN.search(line)
         if match:
             operation, pagination, start, end = match.groups()
             self.progress_bar.setRange(0, int(end))
@@ -319,6 +352,11 @@ class RunnerPanel(QWidget):
 
         # Overwrite support - set the overwrite bool to overwrite the last line instead of appending
         if overwrite:
+            self._flush_text()
+            # appendPlainText() follows the output only while the view is at the
+            # bottom. Do the same here, so scrolling up to read history is not undone
+            scroll_bar = self.text.verticalScrollBar()
+            at_bottom = scroll_bar.value() == scroll_bar.maximum()
             cursor = self.text.textCursor()
             cursor.movePosition(QTextCursor.MoveOperation.End)
             cursor.movePosition(
@@ -327,17 +365,43 @@ class RunnerPanel(QWidget):
             )
             cursor.removeSelectedText()
             cursor.insertText(line.strip())
+            if at_bottom:
+                scroll_bar.setValue(scroll_bar.maximum())
         else:
-            self.text.appendPlainText(line)
+            self._pending_text.append(line)
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
         self.previous_line = line
 
-    def finished(self) -> None:
+    def handle_error(self, error: QProcess.ProcessError) -> None:
+        logger.warning(
+            f"Subprocess {self.process.program()} error: {self.process.errorString()}"
+        )
+        # QProcess never emits finished() for a program that failed to start,
+        # so report it here instead of leaving the runner waiting
+        if error == QProcess.ProcessError.FailedToStart:
+            self.message(f"Failed to start subprocess: {self.process.errorString()}")
+            self.change_progress_bar_color("critical")
+            self.kill_process_button.hide()
+
+    def finished(
+        self,
+        exit_code: int = 0,
+        exit_status: QProcess.ExitStatus = QProcess.ExitStatus.NormalExit,
+    ) -> None:
+        # Flush any output still buffered after the last readyRead
+        self.handle_output(final=True)
         # Handle output filtering if todds dry run support is not enabled
         if not self.todds_dry_run_support:
-            # Determine message based on whether the process was killed
-            self.message(
-                "Subprocess killed!" if self.process_killed else "Subprocess completed."
-            )
+            # Determine message based on whether the process was killed or failed
+            if self.process_killed:
+                self.message("Subprocess killed!")
+            elif exit_status == QProcess.ExitStatus.CrashExit:
+                self.message("Subprocess crashed!")
+            elif exit_code != 0:
+                self.message(f"Subprocess completed with exit code {exit_code}.")
+            else:
+                self.message("Subprocess completed.")
             self.process_killed = False  # Reset the kill flag
 
             # Process-specific logic for steamcmd
@@ -406,6 +470,9 @@ class RunnerPanel(QWidget):
             if "todds" in self.process.program():
                 self.change_progress_bar_color("success")
 
+        # Make sure all output is shown before prompting the user
+        self._flush_text()
+
         # Cleanup process
         self.process.terminate()
         diag = BinaryChoiceDialog(
@@ -1,5 +1,11 @@
+from pathlib import Path
+
+import msgspec
+import pytest
+
 from app.utils.generic import (
     check_valid_http_git_url,
+    decode_json_file,
     extract_git_dir_name,
     extract_git_user_or_org,
 )
@@ -33,3 +39,17 @@ def test_check_valid_http_git_url() -> None:
     assert check_valid_http_git_url("https://github.com/org/RimSort.git") is True
 
     assert check_valid_http_git_url("http://github.com/org/RimSort.git/") is True
+
+
+def test_decode_json_file(tmp_path: Path) -> None:
+    json_file = tmp_path / "db.json"
+    json_file.write_text('{"version": 1, "rules": {"a.b": {"loadAfter": {}}}}')
+    assert decode_json_file(json_file) == {
+        "version": 1,
+        "rules": {"a.b": {"loadAfter": {}}},
+    }
+
+    empty_file = tmp_path / "empty.json"
+    empty_file.touch()
+    with pytest.raises(msgspec.DecodeError):
+        decode_json_file(empty_file)
@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pytest
+
+from app.utils.xml import mods_list_path_to_json, xml_path_to_json
+
+MODS_CONFIG = """<?xml version="1.0" encoding="utf-8"?>
+<ModsConfigData>
+  <version>1.5.4104 rev435</version>
+  <activeMods>
+    <li>ludeon.rimworld</li>
+    <li>ludeon.rimworld.royalty</li>
+    <li>brrainz.harmony</li>
+  </activeMods>
+  <knownExpansions>
+    <li>ludeon.rimworld.royalty</li>
+  </knownExpansions>
+</ModsConfigData>
+"""
+
+SAVEGAME = """<?xml version="1.0" encoding="utf-8"?>
+<savegame>
+  <meta>
+    <gameVersion>1.5.4104 rev435</gameVersion>
+    <modIds>
+      <li>ludeon.rimworld</li>
+      <li>brrainz.harmony</li>
+    </modIds>
+    <modSteamIds>
+      <li>0</li>
+      <li>2009463077</li>
+    </modSteamIds>
+  </meta>
+  <game>
+    <li>not a mod id</li>
+  </game>
+</savegame>
+"""
+
+MODLIST = """<?xml version="1.0" encoding="utf-8"?>
+<savedModList>
+  <meta>
+    <modIds>
+      <li>ludeon.rimworld</li>
+    </modIds>
+  </meta>
+</savedModList>
+"""
+
+
+@pytest.mark.parametrize(
+    "content, keys",
+    [
+        (MODS_CONFIG, ("ModsConfigData", "activeMods")),
+        (SAVEGAME, ("savegame", "meta", "modIds")),
+        (MODLIST, ("savedModList", "meta", "modIds")),
+    ],
+)
+def test_mods_list_path_to_json(
+    tmp_path: Path, content: str, keys: tuple[str, ...]
+) -> None:
+    path = tmp_path / "mods_list.xml"
+    path.write_text(content, encoding="utf-8")
+
+    expected = xml_path_to_json(str(path))
+    result = mods_list_path_to_json(str(path))
+    for key in keys:
+        expected = expected[key]
+        result = result[key]
+    expected_ids = expected["li"]
+    if isinstance(expected_ids, str):
+        expected_ids = [expected_ids]
+    assert result == {"li": expected_ids}
+
+
+def test_mods_list_path_to_json_stops_after_mod_ids(tmp_path: Path) -> None:
+    # Anything after the mod ids is never parsed, even if it is malformed
+    path = tmp_path / "save.rws"
+    path.write_text(SAVEGAME.replace("</savegame>", "<broken>"), encoding="utf-8")
+
+    assert mods_list_path_to_json(str(path)) == {
+        "savegame": {"meta": {"modIds": {"li": ["ludeon.rimworld", "brrainz.harmony"]}}}
+    }
+
+
+def test_mods_list_path_to_json_missing_file(tmp_path: Path) -> None:
+    assert mods_list_path_to_json(str(tmp_path / "missing.xml")) == {}